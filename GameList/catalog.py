@@ -0,0 +1,241 @@
+import json
+import os
+import sqlite3
+import sys
+from array import array
+from GameList.specs import SPEC_FIELDS, SPECS_VERSION, parse_specs
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    id INTEGER PRIMARY KEY,
+    title TEXT NOT NULL UNIQUE,
+    banner_url TEXT,
+    original_url TEXT,
+    text_content TEXT,
+    system_requirements TEXT,
+    game_info TEXT,
+    screenshots TEXT,       -- JSON list
+    downloads TEXT,         -- JSON list
+    source_hash TEXT        -- hash of the scraped record this row was built from
+);
+"""
+
+# Columns added after the first release, created on older databases when they're opened
+ADDED_COLUMNS = {
+    "source_hash": "TEXT",
+    # Typed fields parsed from the requirement / info text at format time (GameList/specs.py)
+    "ram_gb": "REAL",
+    "storage_gb": "REAL",
+    "game_size_gb": "REAL",
+    "install_gb": "REAL",
+    "gpu_tier": "INTEGER",
+    "release_date": "TEXT",
+}
+
+# Sorted indexes so the GUI can filter and order by these without touching the text
+INDEX_SCHEMA = "".join(
+    f"CREATE INDEX IF NOT EXISTS games_{field} ON games({field}, title);\n" for field in SPEC_FIELDS
+)
+
+# External-content FTS table kept in sync with `games` by triggers
+FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS games_fts USING fts5(
+    title, text_content, content='games', content_rowid='id',
+    tokenize='unicode61 remove_diacritics 2'
+);
+CREATE TRIGGER IF NOT EXISTS games_ai AFTER INSERT ON games BEGIN
+    INSERT INTO games_fts(rowid, title, text_content) VALUES (new.id, new.title, new.text_content);
+END;
+CREATE TRIGGER IF NOT EXISTS games_ad AFTER DELETE ON games BEGIN
+    INSERT INTO games_fts(games_fts, rowid, title, text_content)
+    VALUES ('delete', old.id, old.title, old.text_content);
+END;
+CREATE TRIGGER IF NOT EXISTS games_au AFTER UPDATE ON games BEGIN
+    INSERT INTO games_fts(games_fts, rowid, title, text_content)
+    VALUES ('delete', old.id, old.title, old.text_content);
+    INSERT INTO games_fts(rowid, title, text_content) VALUES (new.id, new.title, new.text_content);
+END;
+"""
+
+TEXT_FIELDS = ("banner_url", "original_url", "text_content", "system_requirements", "game_info")
+LIST_FIELDS = ("screenshots", "downloads")
+FIELDS = TEXT_FIELDS + LIST_FIELDS + SPEC_FIELDS
+
+
+def _fts_available(conn):
+    try:
+        conn.execute("CREATE VIRTUAL TABLE temp.fts_probe USING fts5(x)")
+        conn.execute("DROP TABLE temp.fts_probe")
+        return True
+    except sqlite3.OperationalError:
+        return False
+
+
+def _add_missing_columns(conn):
+    existing = {row[1] for row in conn.execute("PRAGMA table_info(games)")}
+    added = [column for column in ADDED_COLUMNS if column not in existing]
+    for column in added:
+        conn.execute(f"ALTER TABLE games ADD COLUMN {column} {ADDED_COLUMNS[column]}")
+    return added
+
+
+def _backfill_specs(conn):
+    # Catalogs formatted before the typed fields existed: parse their stored text once
+    rows = conn.execute("SELECT id, system_requirements, game_info FROM games").fetchall()
+    conn.executemany(
+        "UPDATE games SET {} WHERE id = ?".format(", ".join(f"{field} = ?" for field in SPEC_FIELDS)),
+        ([*parse_specs(requirements, info).values(), game_id] for game_id, requirements, info in rows),
+    )
+
+
+def _row_values(title, record, source_hash=None):
+    values = [title, source_hash]
+    for field in TEXT_FIELDS:
+        value = record.get(field)
+        # Older scrapes kept text_content as a list of paragraphs
+        if isinstance(value, list):
+            value = "\n".join(value)
+        values.append(value)
+    for field in LIST_FIELDS:
+        value = record.get(field) or []
+        values.append(json.dumps([value] if isinstance(value, str) else value))
+    specs = record
+    if any(field not in record for field in SPEC_FIELDS):
+        # Records from before the typed fields (e.g. a migrated game_list.json): parse their text
+        specs = {**parse_specs(record.get("system_requirements"), record.get("game_info")), **record}
+    for field in SPEC_FIELDS:
+        values.append(specs.get(field))
+    return values
+
+
+class CatalogStore:
+    """On-disk game catalog (SQLite, with FTS5 full-text search when available).
+
+    The GUI only keeps the titles in memory and asks for full records one at
+    a time through get().
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(SCHEMA)
+        added = set(_add_missing_columns(self.conn))
+        if added & set(SPEC_FIELDS) or self.conn.execute("PRAGMA user_version").fetchone()[0] < SPECS_VERSION:
+            _backfill_specs(self.conn)
+            self.conn.execute(f"PRAGMA user_version = {SPECS_VERSION}")
+        self.conn.executescript(INDEX_SCHEMA)
+        self.has_fts = _fts_available(self.conn)
+        if self.has_fts:
+            self.conn.executescript(FTS_SCHEMA)
+        self.conn.commit()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self):
+        return self.conn.execute("SELECT COUNT(*) FROM games").fetchone()[0]
+
+    def close(self):
+        self.conn.close()
+
+    def titles(self):
+        # Interned, so every in-memory structure keyed by title (model, search index, spec
+        # orders) shares one string per game instead of holding its own copy
+        return [sys.intern(row[0]) for row in self.conn.execute("SELECT title FROM games ORDER BY title")]
+
+    def get(self, title):
+        row = self.conn.execute(
+            "SELECT {} FROM games WHERE title = ?".format(", ".join(FIELDS)), (title,)
+        ).fetchone()
+        if row is None:
+            return None
+        record = dict(zip(FIELDS, row))
+        for field in LIST_FIELDS:
+            record[field] = json.loads(record[field] or "[]")
+        return record
+
+    def source_hashes(self):
+        return dict(self.conn.execute("SELECT title, source_hash FROM games"))
+
+    def transaction(self):
+        # `with store.transaction():` commits on success and rolls back on error
+        return self.conn
+
+    def sorted_by(self, field):
+        """(values, titles) for the games where `field` is known, ascending.
+
+        Numeric values come back as a packed array('d') rather than a list of
+        floats, so a cached order costs 8 bytes per game plus the title pointer.
+        """
+        if field not in SPEC_FIELDS:
+            raise ValueError(f"Not a sortable field: {field}")
+        rows = self.conn.execute(
+            f"SELECT {field}, title FROM games WHERE {field} IS NOT NULL ORDER BY {field}, title"
+        )
+        values = [] if ADDED_COLUMNS[field] == "TEXT" else array('d')
+        titles = []
+        for value, title in rows:
+            values.append(value)
+            titles.append(sys.intern(title))
+        return values, titles
+
+    def put(self, title, record, source_hash=None):
+        self.conn.execute(
+            "INSERT INTO games (title, source_hash, {0}) VALUES (?, ?, {1}) "
+            "ON CONFLICT(title) DO UPDATE SET source_hash = excluded.source_hash, {2}".format(
+                ", ".join(FIELDS),
+                ", ".join("?" * len(FIELDS)),
+                ", ".join(f"{field} = excluded.{field}" for field in FIELDS),
+            ),
+            _row_values(title, record, source_hash),
+        )
+
+    def delete(self, title):
+        self.conn.execute("DELETE FROM games WHERE title = ?", (title,))
+
+    def replace_all(self, records):
+        # records: iterable of (title, record) pairs, written in a single transaction
+        with self.conn:
+            self.conn.execute("DELETE FROM games")
+            for title, record in records:
+                self.put(title, record)
+
+    def import_json(self, json_file):
+        with open(json_file, 'r') as file:
+            data = json.load(file)
+        # The scraper's URL list shares the old file name, only import real catalogs
+        if isinstance(data, dict):
+            self.replace_all(data.items())
+
+    def search_text(self, query, limit=200):
+        """Titles whose title or description matches `query`, best match first."""
+        words = query.split()
+        if not words:
+            return []
+        if self.has_fts:
+            # Quote each word so user input never reaches the FTS query syntax
+            match = " ".join('"{}"*'.format(word.replace('"', '""')) for word in words)
+            rows = self.conn.execute(
+                "SELECT games.title FROM games_fts JOIN games ON games.id = games_fts.rowid "
+                "WHERE games_fts MATCH ? ORDER BY rank LIMIT ?",
+                (match, limit),
+            )
+        else:
+            clause = " AND ".join("(title LIKE ? OR text_content LIKE ?)" for _ in words)
+            params = [f"%{word}%" for word in words for _ in range(2)]
+            rows = self.conn.execute(
+                f"SELECT title FROM games WHERE {clause} ORDER BY title LIMIT ?", params + [limit]
+            )
+        return [row[0] for row in rows]
+
+
+def open_catalog(path, legacy_json_file=None):
+    store = CatalogStore(path)
+    # One-time migration from the old all-in-one JSON catalog
+    if legacy_json_file and not len(store) and os.path.exists(legacy_json_file):
+        store.import_json(legacy_json_file)
+    return store
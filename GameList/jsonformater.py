@@ -1,71 +1,154 @@
+import hashlib
 import json
 import re
+import tracing
+from GameList.catalog import CatalogStore
+from GameList.specs import parse_specs
 
-def clean():
-    # Load the JSON data from the file
-    with open('scraped_results.json', 'r') as jsfile:
-        data = json.load(jsfile)
-
-    # Base URL for images
-    images = "https://steamrip.com/wp-content/uploads/"
-    steamrip_base = "https://steamrip.com/"
-
-    # Create a new dictionary to store updated data
-    updated_data = {}
-
-    # Process each item in the JSON data
-    for title, content in data.items():
-        # Remove "Free Download" from the title
-        new_title = title.replace(" Free Download", "")
-        
-        # Process URLs
-        rawurls = content["other_urls"]
-        urls = []
-        download_urls = []
-        original_url = None
-        
-        # Separate URLs into screenshots, download URLs, and original URL
-        for b in rawurls:
-            if str(b).startswith(images):
-                urls.append(b)
-            elif str(b).startswith(steamrip_base):
-                original_url = b
-            else:
-                download_urls.append(b)
-        
-        # Update the JSON structure
-        content.pop("image_urls", None)  # Remove image_urls if it exists
-        content.pop("other_urls", None)  # Remove other_urls if it exists
-        content["text_content"].pop(0)
-        content["text_content"] = [text.replace("Direct Download", "") for text in content["text_content"]]
-        content['screenshots'] = urls
-        content['downloads'] = download_urls
-        content['original_url'] = original_url
-        
-        # Extract System Requirements and Game Info
-        origin = content['text_content']
-        
-        cleaned_text = '\n'.join(origin[0].split('\n', 1)[1:])  # Remove the first sentence
-        cleaned_text = re.sub(r'(.*?DOWNLOAD HERE)', '', cleaned_text, flags=re.MULTILINE).strip()  # Remove all download services
-        cleaned_text = cleaned_text.replace("\nSCREENSHOTS", "")  # Remove "SCREENSHOTS"
-
-        system_requirements_match = re.search(r'SYSTEM REQUIREMENTS\n(.*?)\nGAME INFO', cleaned_text, re.S)
-        game_info_match = re.search(r'GAME INFO\n(.*)', cleaned_text, re.S)
-
-        system_requirements = system_requirements_match.group(1).strip() if system_requirements_match else "Not found"
-        game_info = game_info_match.group(1).strip() if game_info_match else "Not found"
-
-        # Update the content with new keys
-        content['system_requirements'] = system_requirements
-        content['game_info'] = game_info
-
-        # Remove extracted parts from text_content
-        cleaned_text = re.sub(r'SYSTEM REQUIREMENTS\n.*?\nGAME INFO\n.*', '', cleaned_text, flags=re.S).strip()
-        content['text_content'] = cleaned_text
-        
-        # Add the updated content to the new dictionary with the new title
-        updated_data[new_title] = content
-
-    # Optionally, write the cleaned data back to a file
-    with open('cleaned_results.json', 'w') as outfile:
-        json.dump(updated_data, outfile, indent=4)
+# Base URL for images
+images = "https://steamrip.com/wp-content/uploads/"
+steamrip_base = "https://steamrip.com/"
+
+# Patterns are compiled once instead of on every record
+DOWNLOAD_MARKER = "DOWNLOAD HERE"
+SYSTEM_REQUIREMENTS_RE = re.compile(r'SYSTEM REQUIREMENTS\n(.*?)\nGAME INFO', re.S)
+GAME_INFO_RE = re.compile(r'GAME INFO\n(.*)', re.S)
+EXTRACTED_SECTIONS_RE = re.compile(r'SYSTEM REQUIREMENTS\n.*?\nGAME INFO\n.*', re.S)
+WHITESPACE_RE = re.compile(r'\s*')
+SEPARATOR_RE = re.compile(r'[\s,]*')
+
+
+def iter_json_items(path, chunk_size=1024 * 1024):
+    # Yield the (key, value) pairs of a top-level JSON object without loading the whole file
+    decoder = json.JSONDecoder()
+    with open(path, 'r') as jsfile:
+        buffer = ''
+        pos = 0
+        eof = False
+        opened = False
+        while True:
+            try:
+                if not opened:
+                    pos = WHITESPACE_RE.match(buffer, pos).end()
+                    if buffer[pos] != '{':
+                        raise ValueError(f"{path} does not hold a JSON object")
+                    pos += 1
+                    opened = True
+                item_start = SEPARATOR_RE.match(buffer, pos).end()
+                if buffer[item_start] == '}':
+                    return
+                key, end = decoder.raw_decode(buffer, item_start)
+                end = WHITESPACE_RE.match(buffer, end).end()
+                if buffer[end] != ':':
+                    raise json.JSONDecodeError("Expecting ':'", buffer, end)
+                end = WHITESPACE_RE.match(buffer, end + 1).end()
+                value, end = decoder.raw_decode(buffer, end)
+                # A value cut by the chunk boundary can still decode ("-2500." as -2500), so the
+                # item only counts once the ',' or '}' after it is in the buffer
+                follow = WHITESPACE_RE.match(buffer, end).end()
+                if buffer[follow] not in ',}':
+                    raise json.JSONDecodeError("Expecting ',' delimiter", buffer, follow)
+            except (IndexError, json.JSONDecodeError):
+                if eof:
+                    raise
+                # Incomplete item at the end of the buffer: drop what's consumed, read on
+                buffer = buffer[pos:]
+                pos = 0
+                chunk = jsfile.read(chunk_size)
+                eof = not chunk
+                buffer += chunk
+                continue
+            pos = end
+            yield key, value
+
+
+def strip_download_services(text):
+    # Same result as re.sub(r'(.*?DOWNLOAD HERE)', '', text, flags=re.M): on every line, drop
+    # everything up to the last "DOWNLOAD HERE". The regex retries at each position of lines
+    # without the marker, which is quadratic in the line length.
+    if DOWNLOAD_MARKER not in text:
+        return text
+    return '\n'.join(line.rpartition(DOWNLOAD_MARKER)[2] for line in text.split('\n'))
+
+
+def content_hash(content):
+    return hashlib.sha1(json.dumps(content, sort_keys=True).encode()).hexdigest()
+
+
+def clean_record(title, content):
+    # Remove "Free Download" from the title
+    new_title = title.replace(" Free Download", "")
+
+    # Separate URLs into screenshots, download URLs, and original URL
+    urls = []
+    download_urls = []
+    original_url = None
+    for b in content.get("other_urls", []):
+        if str(b).startswith(images):
+            urls.append(b)
+        elif str(b).startswith(steamrip_base):
+            original_url = b
+        else:
+            download_urls.append(b)
+
+    # Build the new structure without touching the scraped record
+    record = {key: value for key, value in content.items() if key not in ("image_urls", "other_urls")}
+    text_content = [text.replace("Direct Download", "") for text in content["text_content"][1:]]
+    record['screenshots'] = urls
+    record['downloads'] = download_urls
+    record['original_url'] = original_url
+
+    # Extract System Requirements and Game Info
+    cleaned_text = '\n'.join(text_content[0].split('\n', 1)[1:]) if text_content else ''  # Remove the first sentence
+    cleaned_text = strip_download_services(cleaned_text).strip()  # Remove all download services
+    cleaned_text = cleaned_text.replace("\nSCREENSHOTS", "")  # Remove "SCREENSHOTS"
+
+    system_requirements_match = SYSTEM_REQUIREMENTS_RE.search(cleaned_text)
+    game_info_match = GAME_INFO_RE.search(cleaned_text)
+
+    record['system_requirements'] = system_requirements_match.group(1).strip() if system_requirements_match else "Not found"
+    record['game_info'] = game_info_match.group(1).strip() if game_info_match else "Not found"
+
+    # Remove extracted parts from text_content
+    record['text_content'] = EXTRACTED_SECTIONS_RE.sub('', cleaned_text).strip()
+
+    # Typed fields (RAM, sizes, GPU tier, release date), parsed here once instead of on every query
+    record.update(parse_specs(record['system_requirements'], record['game_info']))
+    return new_title, record
+
+
+def clean(catalog_path='cleaned_results.db', source='scraped_results.json'):
+    """Bring the catalog at `catalog_path` up to date with the scraped results.
+
+    Records are processed one at a time and skipped when their content hash
+    matches the one stored with the catalog row, so only new or changed games
+    are cleaned and written. Returns the applied delta.
+    """
+    delta = {'added': [], 'changed': [], 'removed': [], 'unchanged': 0}
+
+    with tracing.span("format.clean"), CatalogStore(catalog_path) as store:
+        known_hashes = store.source_hashes()
+        seen = set()
+        with store.transaction():
+            for title, content in iter_json_items(source):
+                digest = content_hash(content)
+                new_title = title.replace(" Free Download", "")
+                seen.add(new_title)
+                if known_hashes.get(new_title) == digest:
+                    delta['unchanged'] += 1
+                    continue
+
+                with tracing.span("format.record"):
+                    new_title, record = clean_record(title, content)
+                    store.put(new_title, record, source_hash=digest)
+                delta['changed' if new_title in known_hashes else 'added'].append(new_title)
+                known_hashes[new_title] = digest
+
+            # Games that are no longer on the site
+            for title in known_hashes.keys() - seen:
+                store.delete(title)
+                delta['removed'].append(title)
+
+    print(f"Catalog updated: {len(delta['added'])} added, {len(delta['changed'])} changed, "
+          f"{len(delta['removed'])} removed, {delta['unchanged']} unchanged.")
+    return delta
@@ -85,7 +85,7 @@ def main_menu():
         else:
             print("Invalid choice. Please try again.")
 
-def start_script():
+def start_script(catalog_path='cleaned_results.db'):
     url = "https://steamrip.com/games-list-page/"
     css_selector = 'body > div:nth-of-type(1) > div > div > div > div > div > div > div > div > div'
     json_file = 'game_list.json'
@@ -105,15 +105,15 @@ def start_script():
         json.dump(data, f, indent=2)  # Save the updated data back to 'game_list.json'
 
     GetGameDatas.main()
-    import jsonformater
-    jsonformater.clean()
+    from GameList import jsonformater
+    delta = jsonformater.clean(catalog_path)
     
-    #!os.remove('cleaned_results.json')
-    os.remove('checked_pages.json')
+    os.remove(GetGameDatas.CHECKED_JOURNAL)
+    os.remove(GetGameDatas.RESULTS_JOURNAL)
     os.remove('game_list.json')
     os.remove('scraped_results.json')
-    
-    os.open('cleaned_results.json')
+    # Titles added, changed and removed, for callers that keep the catalog in memory
+    return delta
 
 if __name__ == "__main__":
     url = "https://steamrip.com/games-list-page/"
@@ -135,12 +135,11 @@ if __name__ == "__main__":
         json.dump(data, f, indent=2)  # Save the updated data back to 'game_list.json'
 
     GetGameDatas.main()
-    import jsonformater
+    from GameList import jsonformater
     jsonformater.clean()
     
-    #!os.remove('cleaned_results.json')
-    os.remove('checked_pages.json')
+    #!os.remove('cleaned_results.db')
+    os.remove(GetGameDatas.CHECKED_JOURNAL)
+    os.remove(GetGameDatas.RESULTS_JOURNAL)
     os.remove('game_list.json')
-    os.remove('scraped_results.json')
-    
-    os.open('cleaned_results.json')
\ No newline at end of file
+    os.remove('scraped_results.json')
\ No newline at end of file
@@ -8,6 +8,9 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.firefox.options import Options
 from urllib.parse import urljoin  # To handle relative URLs
 
+CHECKED_JOURNAL = "checked_pages.jsonl"
+RESULTS_JOURNAL = "scraped_results.jsonl"
+
 class ContinuousScraper:
     def __init__(self):
         # Auto-install the geckodriver (Firefox WebDriver)
@@ -73,33 +76,63 @@ def load_urls_from_json(file_path):
         urls = json.load(f)
     return urls
 
+class Journal:
+    # Append-only JSON Lines file: every record costs one line, whatever the size of the file.
+    # Writes are fsync'd in batches, a crash loses at most the last `sync_every` records.
+    def __init__(self, file_path, sync_every=25):
+        self.file_path = file_path
+        self.sync_every = sync_every
+        self.pending = 0
+        # A crash mid-write leaves a partial last line, start on a fresh one
+        needs_newline = False
+        if os.path.exists(file_path) and os.path.getsize(file_path) > 0:
+            with open(file_path, "rb") as f:
+                f.seek(-1, os.SEEK_END)
+                needs_newline = f.read(1) != b"\n"
+        self.file = open(file_path, "a", encoding="utf-8")
+        if needs_newline:
+            self.file.write("\n")
+
+    def append(self, record):
+        self.file.write(json.dumps(record) + "\n")
+        self.pending += 1
+        if self.pending >= self.sync_every:
+            self.sync()
+
+    def sync(self):
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        self.pending = 0
+
+    def close(self):
+        self.sync()
+        self.file.close()
+
+def read_journal(file_path):
+    # Yield the records of a journal, skipping a line left half-written by a crash
+    if not os.path.exists(file_path):
+        return
+    with open(file_path, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                continue
+
 def load_checked_urls(file_path):
-    # Load previously checked URLs from a JSON file
-    if os.path.exists(file_path):
-        with open(file_path, "r") as f:
-            checked_urls = json.load(f)
-    else:
-        checked_urls = []
-    return checked_urls
-
-def save_checked_urls(file_path, checked_urls):
-    # Save checked URLs to a JSON file
-    with open(file_path, "w") as f:
-        json.dump(checked_urls, f, indent=4)
-
-def save_results(results, file_path):
-    # Save all results into a single JSON file, appending new data
-    with open(file_path, "w") as f:
-        json.dump(results, f, indent=4)
-
-def load_existing_results(file_path):
-    # Load existing results if the file exists
-    if os.path.exists(file_path):
-        with open(file_path, "r") as f:
-            existing_results = json.load(f)
-    else:
-        existing_results = {}
-    return existing_results
+    # Set of already checked URLs, so resuming is a constant-time lookup per URL
+    return set(read_journal(file_path))
+
+def compact_results(journal_path, file_path):
+    # Fold the results journal into one JSON object (later entries win) for the formatter
+    results = {}
+    for entry in read_journal(journal_path):
+        results[entry["key"]] = entry["result"]
+    tmp_path = file_path + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(results, f)
+    os.replace(tmp_path, file_path)
+    return len(results)
 
 def main(skip_checked=False):
     # Initialize the scraper (no need for path to geckodriver since it's auto-installed)
@@ -116,14 +149,15 @@ def main(skip_checked=False):
     urls = load_urls_from_json("game_list.json")
     
     # Load previously checked URLs
-    checked_urls = load_checked_urls("checked_pages.json")
+    checked_urls = load_checked_urls(CHECKED_JOURNAL)
 
     # If skip_checked is True, filter out already checked URLs
     if skip_checked:
         urls = [url for url in urls if url not in checked_urls]
 
-    # Load existing results from the output JSON file
-    all_results = load_existing_results("scraped_results.json")
+    # Results and checked URLs are appended to journals as we go
+    results_journal = Journal(RESULTS_JOURNAL)
+    checked_journal = Journal(CHECKED_JOURNAL)
 
     # Scrape each URL
     for url in urls:
@@ -135,8 +169,8 @@ def main(skip_checked=False):
         # Use the first piece of text as the parent key (use the first non-empty text)
         parent_key = result['text_content'][0] if result['text_content'] else hashlib.md5(url.encode()).hexdigest()
 
-        # Save the results in the dictionary, using the parent key
-        all_results[parent_key] = {
+        # Build the result entry, keyed by the parent key
+        entry = {
             "text_content": result["text_content"],
             "other_urls": result["other_urls"],
             "image_urls": result["image_urls"],
@@ -144,25 +178,27 @@ def main(skip_checked=False):
 
         # If there is a banner URL, add it to the results
         if result["banner_url"]:
-            all_results[parent_key]["banner_url"] = result["banner_url"]
-
-        # Add the URL to the checked list
-        checked_urls.append(url)
+            entry["banner_url"] = result["banner_url"]
 
-        # Save the updated checked URLs list immediately
-        save_checked_urls("checked_pages.json", checked_urls)
+        # Append the result first, then mark the URL as checked
+        results_journal.append({"key": parent_key, "result": entry})
+        checked_journal.append(url)
+        checked_urls.add(url)
 
-        # Save the updated results into the JSON file continuously
-        save_results(all_results, "scraped_results.json")
+    results_journal.close()
+    checked_journal.close()
 
     # Close the WebDriver instance after scraping
     scraper.close()
 
+    # One-shot compaction into the JSON file jsonformater reads
+    compact_results(RESULTS_JOURNAL, "scraped_results.json")
+
 if __name__ == "__main__":
     # Parse command-line arguments
     parser = argparse.ArgumentParser(description="Scrape URLs and save results.")
     parser.add_argument('--skip-checked', action='store_true', 
-                        help="Skip already checked URLs based on the checked_pages.json file.")
+                        help="Skip already checked URLs based on the checked_pages.jsonl journal.")
     args = parser.parse_args()
 
     # Run the main function with the parsed argument
@@ -0,0 +1,105 @@
+import re
+from datetime import datetime
+
+# Typed fields pulled out of the free-text "SYSTEM REQUIREMENTS" / "GAME INFO" blocks
+SPEC_FIELDS = ("ram_gb", "storage_gb", "game_size_gb", "install_gb", "gpu_tier", "release_date")
+# Bumped whenever parsing changes, stored catalogs are re-parsed once when opened
+SPECS_VERSION = 2
+
+UNITS = {"MB": 1 / 1024, "GB": 1, "TB": 1024}
+# "4,096 MB": a comma before exactly three digits groups thousands, any other one is a decimal point
+THOUSANDS_RE = re.compile(r',(?=\d{3}(?!\d))')
+
+RAM_RE = re.compile(r'Memory:\s*([\d.,]+)\s*(MB|GB|TB)', re.I)
+STORAGE_RE = re.compile(r'(?:Storage|Hard (?:Drive|Disk)(?: Space)?|Disk Space|HDD|Space):\s*([\d.,]+)\s*(MB|GB|TB)', re.I)
+GAME_SIZE_RE = re.compile(r'Game Size:\s*([\d.,]+)\s*(MB|GB|TB)', re.I)
+GRAPHICS_RE = re.compile(r'(?:Graphics|Video(?: Card)?|GPU):\s*([^\n]+)', re.I)
+RELEASE_RE = re.compile(r'Release(?: Date|d)\s*:\s*([^\n|]+)', re.I)
+DATE_FORMATS = ("%B %d, %Y", "%b %d, %Y", "%d %B, %Y", "%d %B %Y", "%d %b %Y", "%d %b, %Y", "%Y-%m-%d",
+                "%d/%m/%Y", "%B %Y", "%b %Y", "%Y")
+
+# GPU tiers: 0 integrated, 1 entry level, 2 mid range, 3 upper mid range, 4 high end
+NVIDIA_RTX_RE = re.compile(r'RTX\s*(\d{4})', re.I)
+NVIDIA_GTX_RE = re.compile(r'GTX\s*(?:Titan|(\d{3,4}))', re.I)
+NVIDIA_GT_RE = re.compile(r'\bGT\s*\d{3,4}', re.I)
+AMD_RX_RE = re.compile(r'RX\s*(?:Vega|(\d{3,4}))', re.I)
+AMD_R_RE = re.compile(r'\bR([579])\s*\d{3}', re.I)
+AMD_HD_RE = re.compile(r'Radeon\s*HD\s*\d{4}', re.I)
+INTEGRATED_RE = re.compile(r'Intel\s*(?:U?HD|Iris)|Integrated|Onboard', re.I)
+VRAM_RE = re.compile(r'(\d+(?:\.\d+)?)\s*(MB|GB)\s*(?:of\s*)?(?:VRAM|Video|Dedicated|Graphics|GDDR)', re.I)
+
+
+def _size_gb(match):
+    if not match:
+        return None
+    try:
+        number = THOUSANDS_RE.sub('', match.group(1)).replace(',', '.')
+        return round(float(number) * UNITS[match.group(2).upper()], 2)
+    except ValueError:
+        return None
+
+
+def gpu_tier(graphics):
+    # Rough class of the first GPU a requirement names, good enough to sort and filter on
+    match = NVIDIA_RTX_RE.search(graphics)
+    if match:
+        return 4 if int(match.group(1)) >= 3000 else 3
+    match = NVIDIA_GTX_RE.search(graphics)
+    if match:
+        if not match.group(1):
+            return 3
+        model = int(match.group(1))
+        if model >= 1000:
+            return 3 if model >= 1600 or model % 100 >= 60 else 2
+        return 2 if model >= 700 else 1
+    match = AMD_RX_RE.search(graphics)
+    if match:
+        if not match.group(1):
+            return 3
+        model = int(match.group(1))
+        if model >= 1000:
+            return 4 if model >= 6000 else 3
+        return 3 if model % 100 >= 70 else 2
+    match = AMD_R_RE.search(graphics)
+    if match:
+        return 2 if match.group(1) == '9' else 1
+    if NVIDIA_GT_RE.search(graphics) or AMD_HD_RE.search(graphics):
+        return 1
+    if INTEGRATED_RE.search(graphics):
+        return 0
+    match = VRAM_RE.search(graphics)
+    if match:
+        vram = float(match.group(1)) * UNITS[match.group(2).upper()]
+        return 0 if vram < 1 else 1 if vram < 2 else 2 if vram < 4 else 3 if vram < 6 else 4
+    return None
+
+
+def release_date(text):
+    match = RELEASE_RE.search(text)
+    if not match:
+        return None
+    value = re.sub(r'(\d)(st|nd|rd|th)\b', r'\1', match.group(1).strip())
+    for date_format in DATE_FORMATS:
+        try:
+            return datetime.strptime(value, date_format).date().isoformat()
+        except ValueError:
+            continue
+    return None
+
+
+def parse_specs(system_requirements, game_info):
+    system_requirements = system_requirements or ""
+    game_info = game_info or ""
+    graphics = GRAPHICS_RE.search(system_requirements)
+    storage_gb = _size_gb(STORAGE_RE.search(system_requirements))
+    game_size_gb = _size_gb(GAME_SIZE_RE.search(game_info))
+    sizes = [size for size in (storage_gb, game_size_gb) if size is not None]
+    return {
+        "ram_gb": _size_gb(RAM_RE.search(system_requirements)),
+        "storage_gb": storage_gb,
+        "game_size_gb": game_size_gb,
+        # What the drive has to hold: the bigger of the stated requirement and the download
+        "install_gb": max(sizes) if sizes else None,
+        "gpu_tier": gpu_tier(graphics.group(1)) if graphics else None,
+        "release_date": release_date(game_info) or release_date(system_requirements),
+    }
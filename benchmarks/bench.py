@@ -0,0 +1,301 @@
+"""Offline benchmarks for the catalog, search, formatter and extraction paths.
+
+Builds synthetic catalogs and archives in a temporary directory, times each
+stage and records its peak Python memory (tracemalloc).
+
+    python benchmarks/bench.py                              # 1k/10k/100k games, 64 MB archive
+    python benchmarks/bench.py --sizes 1000 --archive-mb 4096
+    python benchmarks/bench.py --save benchmarks/baseline.json
+    python benchmarks/bench.py --compare benchmarks/baseline.json
+
+--compare exits with status 1 when a stage got slower than --tolerance times
+its baseline, so it can gate a change.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import string
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+import zipfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from extractor import extract_archive  # noqa: E402
+from searchindex import SearchIndex, can_refine  # noqa: E402
+from GameList import jsonformater  # noqa: E402
+from GameList.catalog import CatalogStore  # noqa: E402
+
+WORDS = ("dark", "souls", "witcher", "hunt", "wild", "knight", "hollow", "space", "legend", "zelda", "craft",
+         "simulator", "farm", "city", "racing", "edition", "remastered", "deluxe", "chronicles", "war", "empire",
+         "dragon", "age", "origins", "forza", "horizon", "call", "duty", "black", "ops", "tales", "shadow")
+QUERIES = ("dark", "witcher 3", "hol", "simulatr", "dragon age", "s", "remastered edition", "zzzz")
+
+
+def synthetic_title(rng, number):
+    words = rng.sample(WORDS, rng.randint(2, 4))
+    return " ".join(word.title() for word in words) + f" {number}"
+
+
+def synthetic_record(rng, number):
+    title = synthetic_title(rng, number)
+    body = (
+        f"{title} Free Download\n{title} Free Download (v1.{number})\n"
+        + " ".join(rng.choices(WORDS, k=120)) + "\n"
+        "MEGADB DOWNLOAD HERE\nGOFILE DOWNLOAD HERE\nSCREENSHOTS\nSYSTEM REQUIREMENTS\n"
+        "Requires a 64-bit processor and operating system\nOS: Windows 10\n"
+        f"Processor: Intel Core i5-{rng.randint(2000, 9000)}\nMemory: {rng.choice([4, 8, 16, 32])} GB RAM\n"
+        f"Graphics: NVIDIA GeForce GTX {rng.choice([660, 970, 1060, 1660, 2070, 3080])}\n"
+        f"Storage: {rng.randint(1, 150)} GB available space\n"
+        "GAME INFO\nGenre: Action\nDeveloper: Synthetic Studio\nPlatform: PC\n"
+        f"Game Size: {rng.uniform(0.5, 150):.1f} GB\nReleased By: SteamRIP\nVersion: v1.{number}\nPre-Installed Game"
+    )
+    uploads = "https://steamrip.com/wp-content/uploads/2024/01/"
+    return f"{title} Free Download", {
+        "text_content": [f"{title} Free Download", body],
+        "other_urls": [f"{uploads}{number}-{shot}.jpg" for shot in range(4)]
+                      + [f"https://steamrip.com/{number}-free-download/", f"https://megadb.net/{number:x}",
+                         f"https://gofile.io/d/{number:x}"],
+        "image_urls": [],
+        "banner_url": f"{uploads}{number}-banner.jpg",
+    }
+
+
+def write_scraped(path, count, seed=0):
+    rng = random.Random(seed)
+    with open(path, 'w') as file:
+        json.dump(dict(synthetic_record(rng, number) for number in range(count)), file)
+
+
+def write_archive(path, size_mb, seed=0):
+    # Half incompressible data, half text; a few big members and many small ones, like a game
+    rng = random.Random(seed)
+    remaining = size_mb * 1024 * 1024
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as archive:
+        big_size = remaining // 8
+        for number in range(4):
+            with archive.open(f"Game/data/pack{number}.pak", 'w', force_zip64=True) as member:
+                written = 0
+                while written < big_size:
+                    chunk = rng.randbytes(1024 * 1024) if number % 2 else (string.ascii_letters * 20000).encode()
+                    member.write(chunk[:big_size - written])
+                    written += len(chunk)
+        small = remaining - 4 * big_size
+        number = 0
+        while small > 0:
+            size = min(small, rng.randint(4 * 1024, 512 * 1024))
+            archive.writestr(f"Game/assets/{number // 100}/file{number}.bin", rng.randbytes(size))
+            small -= size
+            number += 1
+
+
+# Opens the GUI offscreen in a fresh interpreter, so the module imports count, and prints
+# the window's own first-paint measurement once the first frame is done
+FIRST_PAINT_SCRIPT = """
+import importlib.util, os, sys
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+spec = importlib.util.spec_from_file_location("gui", sys.argv[1])
+gui = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(gui)
+app = gui.QApplication(sys.argv)
+window = gui.GameSearchApp()
+window.show()
+timer = gui.QTimer()
+timer.timeout.connect(lambda: app.quit() if window.first_paint_ms is not None else None)
+timer.start(1)
+app.exec_()
+window.close()
+print("FIRST_PAINT", window.first_paint_ms, gui.STARTUP_BUDGET_MS)
+"""
+
+
+def first_paint_ms(workdir, repeat=3):
+    """Best time to first paint of the GUI (ms) over `repeat` launches, and its budget."""
+    gui = os.path.join(ROOT, "main.newer.test.py")
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    timings = []
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, "-c", FIRST_PAINT_SCRIPT, gui], cwd=workdir, env=env,
+                                capture_output=True, text=True, check=True).stdout
+        line = next(line for line in output.splitlines() if line.startswith("FIRST_PAINT"))
+        _, paint, budget = line.split()
+        timings.append(float(paint))
+    return min(timings), float(budget)
+
+
+def measure(function, repeat=1):
+    """Best wall time of `repeat` runs plus peak traced memory of one more run."""
+    timings = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        timings.append(time.perf_counter() - start)
+    tracemalloc.start()
+    function()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {"seconds": min(timings), "peak_mb": peak / 1024 ** 2}, result
+
+
+def bench_catalog(workdir, count, repeat, results):
+    scraped = os.path.join(workdir, f"scraped_{count}.json")
+    catalog = os.path.join(workdir, f"catalog_{count}.db")
+    write_scraped(scraped, count)
+
+    def format_cold():
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(catalog + suffix):
+                os.remove(catalog + suffix)
+        return jsonformater.clean(catalog, source=scraped)
+
+    results[f"format_cold/{count}"], _ = measure(format_cold)
+    results[f"format_unchanged/{count}"], _ = measure(lambda: jsonformater.clean(catalog, source=scraped), repeat)
+
+    def load_titles():
+        with CatalogStore(catalog) as store:
+            return store.titles()
+
+    results[f"load_titles/{count}"], titles = measure(load_titles, repeat)
+    results[f"index_build/{count}"], index = measure(lambda: SearchIndex(titles), repeat)
+
+    per_query = []
+    for query in QUERIES:
+        start = time.perf_counter()
+        index.search(query)
+        per_query.append(time.perf_counter() - start)
+    results[f"search_mean/{count}"] = {"seconds": statistics.mean(per_query), "peak_mb": None}
+    results[f"search_max/{count}"] = {"seconds": max(per_query), "peak_mb": None}
+
+    # Every query typed a character at a time, searching each prefix in full or narrowing
+    # from the previous one the way the GUI does
+    typed = [query[:end] for query in QUERIES for end in range(1, len(query) + 1)]
+
+    def type_queries(refine):
+        previous = None
+        for text in typed:
+            within = previous[1] if refine and previous and can_refine(*previous, text) else None
+            previous = (text, index.search(text, within=within))
+
+    results[f"type_full/{count}"], _ = measure(lambda: type_queries(False), repeat)
+    results[f"type_refined/{count}"], _ = measure(lambda: type_queries(True), repeat)
+
+    bench_views(titles, index, count, repeat, results)
+
+
+def bench_views(titles, index, count, repeat, results):
+    try:
+        os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+        from PyQt5.QtWidgets import QApplication
+        from gamemodel import GameListModel, GameFilterProxy
+    except ImportError:
+        return
+    app = QApplication.instance() or QApplication(sys.argv)
+    model = GameListModel()
+    proxy = GameFilterProxy()
+    proxy.setSourceModel(model)
+
+    def populate():
+        model.set_titles(titles)
+        app.processEvents()
+
+    def refilter():
+        for query in QUERIES:
+            proxy.set_titles(index.search(query))
+        proxy.set_titles(None)
+        app.processEvents()
+
+    results[f"populate/{count}"], _ = measure(populate, repeat)
+    results[f"filter_all_queries/{count}"], _ = measure(refilter, repeat)
+
+
+def bench_startup(workdir, repeat, results):
+    try:
+        import PyQt5  # noqa: F401
+    except ImportError:
+        return
+    startup_dir = os.path.join(workdir, "startup")
+    os.makedirs(startup_dir, exist_ok=True)
+    paint, budget = first_paint_ms(startup_dir, repeat)
+    results["first_paint"] = {"seconds": paint / 1000, "peak_mb": None}
+    if paint > budget:
+        print(f"First paint took {paint:.0f} ms, over the {budget:.0f} ms budget")
+
+
+def bench_extract(workdir, size_mb, results):
+    archive = os.path.join(workdir, f"archive_{size_mb}mb.zip")
+    write_archive(archive, size_mb)
+    counter = [0]
+
+    def extract():
+        counter[0] += 1
+        return extract_archive(archive, os.path.join(workdir, f"extract_{counter[0]}"))
+
+    results[f"extract/{size_mb}MB"], _ = measure(extract)
+
+
+def compare(results, baseline, tolerance):
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get("results", {}).get(name)
+        if not previous or not previous["seconds"]:
+            continue
+        ratio = current["seconds"] / previous["seconds"]
+        flag = "  REGRESSION" if ratio > tolerance else ""
+        print(f"{name:<28} {ratio:6.2f}x baseline{flag}")
+        if flag:
+            regressions.append(name)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark catalog load, search, formatting and extraction.")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000],
+                        help="Catalog sizes (number of games) to generate.")
+    parser.add_argument('--archive-mb', type=int, default=64, help="Size of the synthetic archive, 0 to skip.")
+    parser.add_argument('--repeat', type=int, default=3, help="Runs per stage, the best one is kept.")
+    parser.add_argument('--save', help="Write the results to this JSON file as a new baseline.")
+    parser.add_argument('--compare', help="Compare against a baseline JSON file.")
+    parser.add_argument('--tolerance', type=float, default=1.25,
+                        help="Slowdown factor over the baseline that counts as a regression.")
+    args = parser.parse_args()
+
+    results = {}
+    with tempfile.TemporaryDirectory(prefix="steamrip-bench-") as workdir:
+        print("Startup...")
+        bench_startup(workdir, args.repeat, results)
+        for count in args.sizes:
+            print(f"Catalog with {count} games...")
+            bench_catalog(workdir, count, args.repeat, results)
+        if args.archive_mb:
+            print(f"Archive of {args.archive_mb} MB...")
+            bench_extract(workdir, args.archive_mb, results)
+
+    print(f"\n{'stage':<28} {'seconds':>10} {'peak MB':>9}")
+    for name, result in results.items():
+        peak = f"{result['peak_mb']:9.1f}" if result['peak_mb'] is not None else f"{'-':>9}"
+        print(f"{name:<28} {result['seconds']:10.4f} {peak}")
+
+    if args.save:
+        with open(args.save, 'w') as file:
+            json.dump({"python": platform.python_version(), "machine": platform.machine(),
+                       "cpus": os.cpu_count(), "results": results}, file, indent=4)
+        print(f"\nBaseline saved to {args.save}")
+
+    if args.compare:
+        with open(args.compare, 'r') as file:
+            baseline = json.load(file)
+        print()
+        if compare(results, baseline, args.tolerance):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
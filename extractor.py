@@ -0,0 +1,152 @@
+import hashlib
+import os
+import shutil
+import threading
+import zipfile
+from concurrent.futures import ThreadPoolExecutor, FIRST_EXCEPTION, wait
+
+import tracing
+
+COPY_BUFFER = 4 * 1024 * 1024
+# Members at least this big get a worker of their own, smaller ones are batched
+LARGE_MEMBER = 32 * 1024 * 1024
+BATCH_BYTES = 64 * 1024 * 1024
+
+
+class NotEnoughSpaceError(OSError):
+    pass
+
+
+class ExtractionCancelled(Exception):
+    pass
+
+
+def member_target(dest, name):
+    # Same sanitizing as ZipFile.extract: no absolute paths, drives or ".." escapes
+    name = name.replace('/', os.path.sep)
+    if os.path.altsep:
+        name = name.replace(os.path.altsep, os.path.sep)
+    name = os.path.splitdrive(name)[1]
+    parts = [part for part in name.split(os.path.sep) if part not in ('', os.path.curdir, os.path.pardir)]
+    return os.path.join(dest, *parts) if parts else None
+
+
+def check_free_space(members, dest):
+    required = sum(member.file_size for member in members)
+    free = shutil.disk_usage(dest).free
+    if required > free:
+        raise NotEnoughSpaceError(
+            f"Not enough free space on {dest}: {required / 1024 ** 3:.2f} GB needed, "
+            f"{free / 1024 ** 3:.2f} GB available"
+        )
+    return required
+
+
+def _batches(members):
+    # Biggest first so the long copies start early and the pool drains evenly
+    members = sorted(members, key=lambda member: member.file_size, reverse=True)
+    batch, batch_bytes = [], 0
+    for member in members:
+        if member.file_size >= LARGE_MEMBER:
+            yield [member]
+            continue
+        batch.append(member)
+        batch_bytes += member.file_size
+        if batch_bytes >= BATCH_BYTES:
+            yield batch
+            batch, batch_bytes = [], 0
+    if batch:
+        yield batch
+
+
+def extract_archive(zip_path, dest, workers=None, on_progress=None, should_stop=None):
+    """Extract `zip_path` into `dest` with several threads.
+
+    on_progress(member_name, done_bytes, total_bytes) is called from the worker
+    threads after every copied buffer; should_stop() is polled just as often
+    and aborts the extraction with ExtractionCancelled.
+
+    Returns {relative path: BLAKE2b hex digest} of the extracted files, hashed
+    from the buffers as they're written so there's no second read.
+    """
+    with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+        members = zip_ref.infolist()
+
+    os.makedirs(dest, exist_ok=True)
+    total = check_free_space(members, dest)
+
+    files = []
+    for member in members:
+        target = member_target(dest, member.filename)
+        if target is None:
+            continue
+        if member.is_dir():
+            os.makedirs(target, exist_ok=True)
+        else:
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            files.append(member)
+
+    lock = threading.Lock()
+    failed = threading.Event()
+    done = 0
+    hashes = {}
+    local = threading.local()
+    handles = []
+
+    def archive():
+        # ZipFile handles aren't meant to be shared between threads, each worker opens its own
+        if not hasattr(local, 'zip_ref'):
+            local.zip_ref = zipfile.ZipFile(zip_path, 'r')
+            with lock:
+                handles.append(local.zip_ref)
+        return local.zip_ref
+
+    def extract_batch(batch):
+        try:
+            with tracing.span("extract.batch", members=len(batch), bytes=sum(member.file_size for member in batch)):
+                copy_batch(batch)
+        except BaseException:
+            # Let the other workers stop at their next buffer instead of finishing their copies
+            failed.set()
+            raise
+
+    def copy_batch(batch):
+        nonlocal done
+        buffer = bytearray(COPY_BUFFER)
+        view = memoryview(buffer)
+        for member in batch:
+            target = member_target(dest, member.filename)
+            digest = hashlib.blake2b()
+            with archive().open(member) as src, open(target, 'wb') as dst:
+                while True:
+                    if failed.is_set():
+                        return
+                    if should_stop and should_stop():
+                        raise ExtractionCancelled()
+                    size = src.readinto(view)
+                    if not size:
+                        break
+                    dst.write(view[:size])
+                    digest.update(view[:size])
+                    with lock:
+                        done += size
+                        progress = done
+                    if on_progress:
+                        on_progress(member.filename, progress, total)
+            rel = os.path.relpath(target, dest).replace(os.path.sep, '/')
+            with lock:
+                hashes[rel] = digest.hexdigest()
+
+    try:
+        with tracing.span("extract.archive", members=len(files), bytes=total), \
+                ThreadPoolExecutor(max_workers=workers or min(8, os.cpu_count() or 1)) as executor:
+            futures = [executor.submit(extract_batch, batch) for batch in _batches(files)]
+            finished, pending = wait(futures, return_when=FIRST_EXCEPTION)
+            for future in pending:
+                future.cancel()
+            for future in finished:
+                future.result()
+    finally:
+        for handle in handles:
+            handle.close()
+    return hashes
@@ -0,0 +1,199 @@
+import bisect
+
+from PyQt5.QtCore import Qt, QObject, QModelIndex, QAbstractListModel, QAbstractProxyModel
+
+
+class GameListModel(QAbstractListModel):
+    """Sorted game titles, served straight from a list.
+
+    No per-row objects exist: the view asks for data() only for the rows it
+    actually paints.
+    """
+
+    def __init__(self, titles=(), parent=None):
+        super().__init__(parent)
+        self._titles = sorted(titles)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._titles)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if index.isValid() and role in (Qt.DisplayRole, Qt.ToolTipRole):
+            return self._titles[index.row()]
+        return None
+
+    def set_titles(self, titles):
+        self.beginResetModel()
+        self._titles = sorted(titles)
+        self.endResetModel()
+
+    def insert_title(self, title):
+        row = bisect.bisect_left(self._titles, title)
+        if row < len(self._titles) and self._titles[row] == title:
+            return
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._titles.insert(row, title)
+        self.endInsertRows()
+
+    def remove_title(self, title):
+        row = self.row_of(title)
+        if row < 0:
+            return
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._titles[row]
+        self.endRemoveRows()
+
+    def title(self, row):
+        return self._titles[row]
+
+    def row_of(self, title):
+        row = bisect.bisect_left(self._titles, title)
+        if row < len(self._titles) and self._titles[row] == title:
+            return row
+        return -1
+
+
+class GameFilterProxy(QAbstractProxyModel):
+    """Shows either every source row or a ranked subset of them.
+
+    Unlike QSortFilterProxyModel nothing is asked of the rows that are
+    filtered out, so a new filter costs as much as its result set.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = None           # proxy row -> source row, None passes everything through
+        self._reverse = None        # source row -> proxy row, built on demand
+
+    def setSourceModel(self, model):
+        old = self.sourceModel()
+        if old is not None:
+            old.modelReset.disconnect(self._source_reset)
+            old.dataChanged.disconnect(self._source_data_changed)
+            old.rowsAboutToBeInserted.disconnect(self._source_rows_about_to_be_inserted)
+            old.rowsInserted.disconnect(self._source_rows_inserted)
+            old.rowsAboutToBeRemoved.disconnect(self._source_rows_about_to_be_removed)
+            old.rowsRemoved.disconnect(self._source_rows_removed)
+        self.beginResetModel()
+        super().setSourceModel(model)
+        self._rows = None
+        self._reverse = None
+        self.endResetModel()
+        model.modelReset.connect(self._source_reset)
+        model.dataChanged.connect(self._source_data_changed)
+        model.rowsAboutToBeInserted.connect(self._source_rows_about_to_be_inserted)
+        model.rowsInserted.connect(self._source_rows_inserted)
+        model.rowsAboutToBeRemoved.connect(self._source_rows_about_to_be_removed)
+        model.rowsRemoved.connect(self._source_rows_removed)
+
+    def set_titles(self, titles):
+        """Show only `titles`, in that order; None shows the whole source."""
+        source = self.sourceModel()
+        self.beginResetModel()
+        if titles is None:
+            self._rows = None
+        else:
+            rows = (source.row_of(title) for title in titles)
+            self._rows = [row for row in rows if row >= 0]
+        self._reverse = None
+        self.endResetModel()
+
+    def append_titles(self, titles):
+        """Show `titles` after the rows already shown, without resetting the view."""
+        if self._rows is None:
+            return
+        source = self.sourceModel()
+        rows = [row for row in (source.row_of(title) for title in titles) if row >= 0]
+        if not rows:
+            return
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        self._rows.extend(rows)
+        if self._reverse is not None:
+            self._reverse.update((source_row, first + offset) for offset, source_row in enumerate(rows))
+        self.endInsertRows()
+
+    def _source_reset(self):
+        self.beginResetModel()
+        self._rows = None
+        self._reverse = None
+        self.endResetModel()
+
+    # Source rows come and go one catalog change at a time. Passing everything through they
+    # are forwarded as they are; with a filter, new rows stay hidden until the next filter
+    # and the shown ones are renumbered.
+    def _source_rows_about_to_be_inserted(self, parent, first, last):
+        if self._rows is None:
+            self.beginInsertRows(QModelIndex(), first, last)
+
+    def _source_rows_inserted(self, parent, first, last):
+        if self._rows is None:
+            self.endInsertRows()
+            return
+        count = last - first + 1
+        self._rows = [row + count if row >= first else row for row in self._rows]
+        self._reverse = None
+
+    def _source_rows_about_to_be_removed(self, parent, first, last):
+        if self._rows is None:
+            self.beginRemoveRows(QModelIndex(), first, last)
+            return
+        for proxy_row in reversed(range(len(self._rows))):
+            if first <= self._rows[proxy_row] <= last:
+                self.beginRemoveRows(QModelIndex(), proxy_row, proxy_row)
+                del self._rows[proxy_row]
+                self._reverse = None
+                self.endRemoveRows()
+
+    def _source_rows_removed(self, parent, first, last):
+        if self._rows is None:
+            self.endRemoveRows()
+            return
+        count = last - first + 1
+        self._rows = [row - count if row > last else row for row in self._rows]
+        self._reverse = None
+
+    def _source_data_changed(self, top_left, bottom_right, roles=()):
+        for row in range(top_left.row(), bottom_right.row() + 1):
+            index = self.mapFromSource(self.sourceModel().index(row, 0))
+            if index.isValid():
+                self.dataChanged.emit(index, index, roles)
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid() or self.sourceModel() is None:
+            return 0
+        if self._rows is None:
+            return self.sourceModel().rowCount()
+        return len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else 1
+
+    def index(self, row, column=0, parent=QModelIndex()):
+        if parent.isValid() or column != 0 or not 0 <= row < self.rowCount():
+            return QModelIndex()
+        return self.createIndex(row, column)
+
+    def parent(self, index=None):
+        # parent() without arguments is still QObject.parent
+        if index is None:
+            return QObject.parent(self)
+        return QModelIndex()
+
+    def mapToSource(self, proxy_index):
+        if not proxy_index.isValid():
+            return QModelIndex()
+        row = proxy_index.row()
+        if self._rows is not None:
+            row = self._rows[row]
+        return self.sourceModel().index(row, 0)
+
+    def mapFromSource(self, source_index):
+        if not source_index.isValid():
+            return QModelIndex()
+        row = source_index.row()
+        if self._rows is not None:
+            if self._reverse is None:
+                self._reverse = {source_row: proxy_row for proxy_row, source_row in enumerate(self._rows)}
+            row = self._reverse.get(row, -1)
+        return self.index(row, 0)
@@ -0,0 +1,104 @@
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+
+
+class DiskCache:
+    """Raw downloaded images on disk, capped at `max_bytes`.
+
+    Reads bump a file's mtime, so eviction drops the least recently used
+    files first. Safe to use from several worker threads.
+    """
+
+    def __init__(self, directory, max_bytes=256 * 1024 * 1024):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._size = None   # computed on first write, keeps construction free of disk I/O
+
+    def path_for(self, url):
+        return os.path.join(self.directory, hashlib.sha1(url.encode()).hexdigest())
+
+    def get(self, url):
+        path = self.path_for(url)
+        try:
+            with open(path, 'rb') as file:
+                data = file.read()
+            os.utime(path)
+            return data
+        except OSError:
+            return None
+
+    def put(self, url, data):
+        path = self.path_for(url)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(tmp_path, 'wb') as file:
+                file.write(data)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"Error writing image cache: {e}")
+            return
+        with self._lock:
+            if self._size is None:
+                self._size = sum(entry.stat().st_size for entry in self._entries())
+            else:
+                self._size += len(data)
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def _entries(self):
+        try:
+            return [entry for entry in os.scandir(self.directory)
+                    if entry.is_file() and not entry.name.endswith('.tmp')]
+        except OSError:
+            return []
+
+    def _evict(self):
+        # Trim to 90% of the cap so we don't evict again on the very next write
+        target = self.max_bytes * 0.9
+        entries = sorted(self._entries(), key=lambda entry: entry.stat().st_mtime)
+        self._size = sum(entry.stat().st_size for entry in entries)
+        for entry in entries:
+            if self._size <= target:
+                break
+            try:
+                size = entry.stat().st_size
+                os.remove(entry.path)
+                self._size -= size
+            except OSError:
+                pass
+
+
+class PixmapCache:
+    """LRU of already scaled pixmaps keyed by (url, width, height).
+
+    QPixmap lives on the UI thread, so this cache must only be touched there.
+    """
+
+    def __init__(self, max_bytes=64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self._size = 0
+        self._items = OrderedDict()
+
+    @staticmethod
+    def _cost(pixmap):
+        return pixmap.width() * pixmap.height() * max(pixmap.depth(), 8) // 8
+
+    def get(self, key):
+        pixmap = self._items.get(key)
+        if pixmap is not None:
+            self._items.move_to_end(key)
+        return pixmap
+
+    def put(self, key, pixmap):
+        old = self._items.pop(key, None)
+        if old is not None:
+            self._size -= self._cost(old)
+        self._items[key] = pixmap
+        self._size += self._cost(pixmap)
+        while self._size > self.max_bytes and len(self._items) > 1:
+            _, evicted = self._items.popitem(last=False)
+            self._size -= self._cost(evicted)
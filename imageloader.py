@@ -0,0 +1,127 @@
+import threading
+
+import tracing
+from PyQt5.QtCore import Qt, QObject, QRunnable, QThreadPool, pyqtSignal
+from PyQt5.QtGui import QImage, QPixmap
+
+CHUNK_SIZE = 64 * 1024
+TIMEOUT = 15
+
+_local = threading.local()
+
+
+def _session():
+    # One session per worker thread so connections to the image host are reused
+    if not hasattr(_local, "session"):
+        # Imported here so requests stays off the startup path
+        import requests
+        _local.session = requests.Session()
+    return _local.session
+
+
+class _ImageTask(QRunnable):
+    def __init__(self, loader, generation, key, url, size):
+        super().__init__()
+        self.loader = loader
+        self.generation = generation
+        self.key = key
+        self.url = url
+        self.size = size
+
+    def stale(self):
+        return self.generation != self.loader.generation
+
+    def download(self):
+        data = bytearray()
+        with _session().get(self.url, stream=True, timeout=TIMEOUT) as response:
+            response.raise_for_status()
+            for chunk in response.iter_content(CHUNK_SIZE):
+                # Give up halfway if the user already clicked another game
+                if self.stale():
+                    return None
+                data += chunk
+        return bytes(data)
+
+    def run(self):
+        if self.stale():
+            return
+        try:
+            disk_cache = self.loader.disk_cache
+            data = disk_cache.get(self.url) if disk_cache else None
+            cached = data is not None
+            if cached:
+                tracing.count("image.disk_hits")
+            else:
+                with tracing.span("image.download"):
+                    data = self.download()
+                if data is None:
+                    return
+            with tracing.span("image.decode", bytes=len(data)):
+                image = QImage()
+                if not image.loadFromData(data):
+                    raise ValueError(f"Unsupported image data from {self.url}")
+                # QImage is safe to decode and scale off the UI thread, QPixmap is not
+                image = image.scaled(self.size[0], self.size[1], Qt.KeepAspectRatio, Qt.SmoothTransformation)
+            # Only keep what actually decodes, so error pages never end up in the cache
+            if disk_cache and not cached:
+                disk_cache.put(self.url, data)
+            self.loader.finished.emit(self.generation, self.key, image, "")
+        except Exception as e:
+            self.loader.finished.emit(self.generation, self.key, QImage(), str(e))
+
+
+class ImageLoader(QObject):
+    """Downloads and scales images on a small worker pool.
+
+    load() hands the result to a callback on the UI thread; cancel() drops
+    everything queued or in flight, e.g. when another game is selected.
+    Scaled pixmaps are kept in `memory_cache` and raw files in `disk_cache`,
+    so a game seen before shows up without any I/O or rescaling.
+    """
+
+    finished = pyqtSignal(int, int, QImage, str)
+
+    def __init__(self, max_workers=4, disk_cache=None, memory_cache=None, parent=None):
+        super().__init__(parent)
+        self.disk_cache = disk_cache
+        self.memory_cache = memory_cache
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(max_workers)
+        self.generation = 0
+        self._next_key = 0
+        self._callbacks = {}
+        self.finished.connect(self._deliver)
+
+    def load(self, url, size, on_loaded, on_failed=None):
+        if self.memory_cache is not None:
+            pixmap = self.memory_cache.get((url, size))
+            if pixmap is not None:
+                tracing.count("image.memory_hits")
+                on_loaded(pixmap)
+                return
+        key = self._next_key
+        self._next_key += 1
+        self._callbacks[key] = (url, size, on_loaded, on_failed)
+        self.pool.start(_ImageTask(self, self.generation, key, url, size))
+
+    def cancel(self):
+        self.generation += 1
+        self.pool.clear()
+        self._callbacks.clear()
+
+    def _deliver(self, generation, key, image, error):
+        if generation != self.generation:
+            return
+        callbacks = self._callbacks.pop(key, None)
+        if callbacks is None:
+            return
+        url, size, on_loaded, on_failed = callbacks
+        if error:
+            print(f"Error loading image: {error}")
+            if on_failed:
+                on_failed(error)
+            return
+        pixmap = QPixmap.fromImage(image)
+        if self.memory_cache is not None:
+            self.memory_cache.put((url, size), pixmap)
+        on_loaded(pixmap)
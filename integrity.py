@@ -0,0 +1,126 @@
+import hashlib
+import json
+import mmap
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+MANIFEST_NAME = ".install_manifest.json"
+READ_BUFFER = 4 * 1024 * 1024
+# Files at least this big are hashed through mmap instead of buffered reads
+MMAP_THRESHOLD = 64 * 1024 * 1024
+MMAP_SLICE = 64 * 1024 * 1024
+
+_local = threading.local()
+
+
+def manifest_path(install_path):
+    return os.path.join(install_path, MANIFEST_NAME)
+
+
+def write_manifest(install_path, hashes):
+    # hashes: {relative path: digest} from extract_archive; size and mtime are taken now,
+    # right after extraction, and let verify_install skip files that haven't been touched since
+    files = {}
+    for rel, digest in hashes.items():
+        stat = os.stat(os.path.join(install_path, rel))
+        files[rel] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "hash": digest}
+    _save(install_path, files)
+    return files
+
+
+def load_manifest(install_path):
+    path = manifest_path(install_path)
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r') as file:
+        return json.load(file)["files"]
+
+
+def _save(install_path, files):
+    path = manifest_path(install_path)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'w') as file:
+        json.dump({"algorithm": "blake2b", "files": files}, file)
+    os.replace(tmp_path, path)
+
+
+def hash_file(path):
+    digest = hashlib.blake2b()
+    with open(path, 'rb') as file:
+        size = os.fstat(file.fileno()).st_size
+        if size >= MMAP_THRESHOLD:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                view = memoryview(mapped)
+                try:
+                    for start in range(0, size, MMAP_SLICE):
+                        digest.update(view[start:start + MMAP_SLICE])
+                finally:
+                    view.release()
+        else:
+            # One buffer per hashing thread, allocating 4 MB per file would cost more than
+            # reading the small ones
+            if not hasattr(_local, "view"):
+                _local.view = memoryview(bytearray(READ_BUFFER))
+            view = _local.view
+            while True:
+                read = file.readinto(view)
+                if not read:
+                    break
+                digest.update(view[:read])
+    return digest.hexdigest()
+
+
+def verify_install(install_path, workers=None, full=False, on_progress=None):
+    """Check an install against the manifest written when it was extracted.
+
+    Files with the recorded size and mtime are trusted without reading them
+    unless `full` is set; the rest are hashed in parallel (hashlib releases
+    the GIL on large buffers). on_progress(checked, total) is called as files
+    are done. Returns a report dict.
+    """
+    files = load_manifest(install_path)
+    if files is None:
+        raise FileNotFoundError(f"No integrity manifest in {install_path}")
+
+    report = {"files": len(files), "skipped": 0, "verified": 0, "missing": [], "corrupt": []}
+    to_hash = []
+    for rel, expected in files.items():
+        try:
+            stat = os.stat(os.path.join(install_path, rel))
+        except FileNotFoundError:
+            report["missing"].append(rel)
+            continue
+        if stat.st_size != expected["size"]:
+            report["corrupt"].append(rel)
+        elif not full and stat.st_mtime_ns == expected["mtime_ns"]:
+            report["skipped"] += 1
+        else:
+            to_hash.append((rel, stat.st_mtime_ns))
+
+    checked = len(files) - len(to_hash)
+    if on_progress:
+        on_progress(checked, len(files))
+
+    # Biggest files first so one huge file doesn't start last and run alone
+    to_hash.sort(key=lambda item: files[item[0]]["size"], reverse=True)
+    touched = False
+    with ThreadPoolExecutor(max_workers=workers or min(8, os.cpu_count() or 1)) as executor:
+        digests = executor.map(lambda item: hash_file(os.path.join(install_path, item[0])), to_hash)
+        for (rel, mtime_ns), digest in zip(to_hash, digests):
+            if digest == files[rel]["hash"]:
+                report["verified"] += 1
+                if files[rel]["mtime_ns"] != mtime_ns:
+                    # Same content under a new mtime (e.g. copied to another drive): trust it next time
+                    files[rel]["mtime_ns"] = mtime_ns
+                    touched = True
+            else:
+                report["corrupt"].append(rel)
+            checked += 1
+            if on_progress:
+                on_progress(checked, len(files))
+
+    if touched:
+        _save(install_path, files)
+    report["ok"] = not report["missing"] and not report["corrupt"]
+    return report
@@ -0,0 +1,123 @@
+import json
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+
+def _scan_dir(root, rel, cached, full):
+    # One directory level: (mtime_ns, bytes of direct files, direct file count, subdirectory names).
+    # A directory's mtime only moves when entries are added, removed or renamed, so an
+    # unchanged one reuses its cached totals without listing it. Files rewritten in place
+    # keep the old size until a full rescan.
+    path = os.path.join(root, rel)
+    try:
+        mtime = os.stat(path).st_mtime_ns
+        if cached and cached[0] == mtime and not full:
+            return rel, cached
+        size = files = 0
+        subdirs = []
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.name)
+                elif entry.is_file(follow_symlinks=False):
+                    size += entry.stat(follow_symlinks=False).st_size
+                    files += 1
+        return rel, [mtime, size, files, subdirs]
+    except OSError:
+        return rel, None
+
+
+def scan_installs(jobs, workers=8, full=False):
+    """Walk several install folders in parallel.
+
+    jobs: {install_path: cached_dirs} where cached_dirs is the "dirs" map of a
+    previous scan (or {}). Returns {install_path: entry}, entry being None for
+    folders that no longer exist.
+    """
+    results = {path: {} for path in jobs}
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = {}
+        for path, cached in jobs.items():
+            pending[executor.submit(_scan_dir, path, '', cached.get(''), full)] = path
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                path = pending.pop(future)
+                rel, record = future.result()
+                if record is None:
+                    continue
+                results[path][rel] = record
+                for name in record[3]:
+                    sub = os.path.join(rel, name)
+                    pending[executor.submit(_scan_dir, path, sub, jobs[path].get(sub), full)] = path
+
+    entries = {}
+    for path, dirs in results.items():
+        if '' not in dirs:
+            entries[path] = None
+            continue
+        entries[path] = {
+            "size": sum(record[1] for record in dirs.values()),
+            "files": sum(record[2] for record in dirs.values()),
+            "mtime": max(record[0] for record in dirs.values()) / 1e9,
+            "dirs": dirs,
+        }
+    return entries
+
+
+class Library:
+    """Manifest of installed games: path, size, file count and last change.
+
+    Kept in a JSON file next to the catalog and refreshed incrementally with
+    scan_installs().
+    """
+
+    def __init__(self, manifest_path='library.json'):
+        self.manifest_path = manifest_path
+        self.installs = {}  # install path -> {"title", "size", "files", "mtime", "dirs"}
+
+    def load(self):
+        if os.path.exists(self.manifest_path):
+            with open(self.manifest_path, 'r') as file:
+                self.installs = json.load(file)
+        return self
+
+    def save(self):
+        tmp_path = self.manifest_path + ".tmp"
+        with open(tmp_path, 'w') as file:
+            json.dump(self.installs, file)
+        os.replace(tmp_path, self.manifest_path)
+
+    def register(self, title, path):
+        entry = self.installs.setdefault(path, {"size": 0, "files": 0, "mtime": 0, "dirs": {}})
+        entry["title"] = title
+        self.save()
+
+    def scan_jobs(self, paths=None):
+        # Snapshot of what a scan needs, so the scan itself can run off the UI thread
+        paths = self.installs.keys() if paths is None else paths
+        return {path: self.installs[path].get("dirs", {}) for path in paths if path in self.installs}
+
+    def apply_scan(self, entries):
+        for path, entry in entries.items():
+            if path not in self.installs:
+                continue
+            if entry is None:
+                # Deleted from disk, it's no longer installed
+                del self.installs[path]
+            else:
+                self.installs[path].update(entry)
+        self.save()
+
+    def find(self, title):
+        return next(((path, entry) for path, entry in self.installs.items() if entry.get("title") == title),
+                    (None, None))
+
+    def drive_summary(self, drive):
+        installs = [entry for path, entry in self.installs.items() if path.upper().startswith(drive.upper())]
+        try:
+            free = shutil.disk_usage(drive + os.sep).free
+        except OSError:
+            free = None
+        return {"installed": len(installs), "size": sum(entry["size"] for entry in installs), "free": free}
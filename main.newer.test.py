@@ -1,23 +1,73 @@
+import time
+STARTUP_T0 = time.perf_counter()
+
 import sys
-import json
 import os
-import zipfile
-import shutil
+import bisect
+import threading
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
-                             QLineEdit, QPushButton, QListWidget, QTextEdit, QLabel, 
+                             QLineEdit, QPushButton, QListView, QTextEdit, QLabel, 
                              QMessageBox, QProgressBar, QSplitter, QFrame, QScrollArea,
-                             QFileDialog, QInputDialog, QComboBox)
-from PyQt5.QtGui import QIcon, QPixmap
-from PyQt5.QtCore import Qt, QThread, pyqtSignal
-import requests
-from io import BytesIO
-import megadbdl
+                             QFileDialog, QInputDialog, QComboBox, QCheckBox, QDockWidget,
+                             QPlainTextEdit, QShortcut)
+from PyQt5.QtGui import QIcon, QKeySequence, QFontDatabase
+from PyQt5.QtCore import Qt, QThread, QTimer, pyqtSignal
+import tracing
+from searchindex import SearchIndex, can_refine, normalize
+from gamemodel import GameListModel, GameFilterProxy
+from imageloader import ImageLoader
+from imagecache import DiskCache, PixmapCache
+from extractor import extract_archive
+from library import Library, scan_installs
+from integrity import write_manifest, verify_install
+
+# requests, megadbdl (selenium, webdriver_manager) and the catalog are imported
+# where they're first used, and the catalog loads after the first frame is on screen.
+# tests/test_startup.py fails when the first paint goes over this budget.
+STARTUP_BUDGET_MS = 400
+
+# Sort choices: (label, catalog field or None for relevance/name, descending)
+SORT_OPTIONS = [
+    ("Sort: best match", None, False),
+    ("Sort: RAM required", "ram_gb", False),
+    ("Sort: size on disk", "install_gb", False),
+    ("Sort: GPU requirement", "gpu_tier", False),
+    ("Sort: newest first", "release_date", True),
+]
+GPU_TIERS = ["Integrated", "Entry level", "Mid range", "Upper mid range", "High end"]
+
+# Search runs this long after the last keystroke; long results are mapped into the view
+# a chunk per event loop turn, the first rows right away
+SEARCH_DEBOUNCE_MS = 150
+STREAM_FIRST_ROWS = 200
+STREAM_CHUNK_ROWS = 5000
+
+def format_size(num_bytes):
+    for unit in ("B", "KB", "MB", "GB"):
+        if abs(num_bytes) < 1024:
+            return f"{num_bytes:.1f} {unit}" if unit != "B" else f"{num_bytes} B"
+        num_bytes /= 1024
+    return f"{num_bytes:.1f} TB"
+
+def format_duration(seconds):
+    seconds = int(seconds)
+    if seconds >= 3600:
+        return f"{seconds // 3600}h {seconds % 3600 // 60}m"
+    if seconds >= 60:
+        return f"{seconds // 60}m {seconds % 60}s"
+    return f"{seconds}s"
 
 class DownloadThread(QThread):
     progress_update = pyqtSignal(int)
+    # downloaded bytes, total bytes (0 if unknown), bytes per second, ETA in seconds (-1 if unknown)
+    stats_update = pyqtSignal('qint64', 'qint64', float, float)
     download_complete = pyqtSignal(str)
     download_error = pyqtSignal(str)
 
+    BUFFER_SIZE = 1024 * 1024  # 1 MB, reused for every read
+    STATS_INTERVAL = 0.25  # seconds between throughput updates
+    SPEED_SMOOTHING = 0.3  # weight of the newest sample in the moving average
+
     def __init__(self, url, save_path):
         super().__init__()
         self.url = url
@@ -25,21 +75,170 @@ class DownloadThread(QThread):
 
     def run(self):
         try:
-            response = requests.get(self.url, stream=True)
-            response.raise_for_status()
-            total_size = int(response.headers.get('content-length', 0))
-            block_size = 8192  # 8 KB
-            with open(self.save_path, 'wb') as file:
+            import requests
+            with requests.get(self.url, stream=True) as response:
+                response.raise_for_status()
+                total_size = int(response.headers.get('content-length', 0))
+                response.raw.decode_content = True
+                buffer = bytearray(self.BUFFER_SIZE)
+                view = memoryview(buffer)
                 downloaded = 0
-                for data in response.iter_content(block_size):
-                    size = file.write(data)
-                    downloaded += size
-                    if total_size > 0:
-                        self.progress_update.emit(int(downloaded / total_size * 100))
+                last_percent = -1
+                last_time = time.monotonic()
+                last_downloaded = 0
+                speed = None
+                with open(self.save_path, 'wb') as file:
+                    while True:
+                        size = response.raw.readinto(view)
+                        if not size:
+                            break
+                        file.write(view[:size])
+                        downloaded += size
+
+                        # Signals only go out when the percentage moves or the stats are due,
+                        # not once per read
+                        if total_size > 0:
+                            percent = int(downloaded / total_size * 100)
+                            if percent != last_percent:
+                                last_percent = percent
+                                self.progress_update.emit(percent)
+                        now = time.monotonic()
+                        if now - last_time >= self.STATS_INTERVAL:
+                            sample = (downloaded - last_downloaded) / (now - last_time)
+                            speed = sample if speed is None else (
+                                self.SPEED_SMOOTHING * sample + (1 - self.SPEED_SMOOTHING) * speed)
+                            eta = (total_size - downloaded) / speed if total_size > 0 and speed > 0 else -1
+                            self.stats_update.emit(downloaded, total_size, speed, eta)
+                            last_time = now
+                            last_downloaded = downloaded
             self.download_complete.emit(self.save_path)
         except Exception as e:
             self.download_error.emit(str(e))
 
+class ExtractThread(QThread):
+    progress_update = pyqtSignal(int)
+    member_progress = pyqtSignal(str, 'qint64', 'qint64')
+    extract_complete = pyqtSignal(str)
+    extract_error = pyqtSignal(str)
+
+    def __init__(self, zip_path, extract_path):
+        super().__init__()
+        self.zip_path = zip_path
+        self.extract_path = extract_path
+        self.percent = -1
+
+    def report(self, member, done, total):
+        # Called from the extraction workers; signal emission is thread-safe
+        self.member_progress.emit(member, done, total)
+        percent = int(done / total * 100) if total else 100
+        if percent != self.percent:
+            self.percent = percent
+            self.progress_update.emit(percent)
+
+    def run(self):
+        try:
+            hashes = extract_archive(self.zip_path, self.extract_path,
+                                     on_progress=self.report, should_stop=self.isInterruptionRequested)
+            os.remove(self.zip_path)  # Remove the zip file after extraction
+            write_manifest(self.extract_path, hashes)
+            self.extract_complete.emit(self.extract_path)
+        except Exception as e:
+            self.extract_error.emit(str(e) or type(e).__name__)
+
+class VerifyThread(QThread):
+    progress_update = pyqtSignal(int)
+    verify_complete = pyqtSignal(str, object)
+    verify_error = pyqtSignal(str)
+
+    def __init__(self, install_path, full=False):
+        super().__init__()
+        self.install_path = install_path
+        self.full = full
+
+    def report(self, checked, total):
+        self.progress_update.emit(int(checked / total * 100) if total else 100)
+
+    def run(self):
+        try:
+            result = verify_install(self.install_path, full=self.full, on_progress=self.report)
+            self.verify_complete.emit(self.install_path, result)
+        except Exception as e:
+            self.verify_error.emit(str(e))
+
+class LibraryScanThread(QThread):
+    scan_complete = pyqtSignal(object)
+
+    def __init__(self, jobs):
+        super().__init__()
+        self.jobs = jobs
+
+    def run(self):
+        self.scan_complete.emit(scan_installs(self.jobs))
+
+class CatalogUpdateThread(QThread):
+    update_complete = pyqtSignal(object)
+    update_error = pyqtSignal(str)
+
+    def __init__(self, catalog_path):
+        super().__init__()
+        self.catalog_path = catalog_path
+
+    def run(self):
+        try:
+            # Scrapes the site and updates the catalog in place through its own connection;
+            # WAL lets the UI keep reading meanwhile
+            from GameList.main import start_script
+            self.update_complete.emit(start_script(catalog_path=self.catalog_path))
+        except Exception as e:
+            self.update_error.emit(str(e))
+
+class SearchThread(QThread):
+    index_ready = pyqtSignal(object, object)
+    results_ready = pyqtSignal(int, str, object)
+
+    def __init__(self, catalog_path):
+        super().__init__()
+        self.catalog_path = catalog_path
+        self.index = None
+        self.condition = threading.Condition()
+        self.pending = None
+        self.stopping = False
+
+    def submit(self, generation, query, within=None):
+        with self.condition:
+            # Only the newest query matters, one still waiting is simply replaced
+            self.pending = (generation, query, within)
+            self.condition.notify()
+
+    def stop(self):
+        with self.condition:
+            self.stopping = True
+            self.condition.notify()
+
+    def run(self):
+        # Titles and index are built here first, through a connection of this thread's own,
+        # so the window stays responsive while a big catalog loads
+        from GameList.catalog import CatalogStore
+        with tracing.span("catalog.titles"), CatalogStore(self.catalog_path) as store:
+            titles = store.titles()
+        with tracing.span("search.index_build", titles=len(titles)):
+            self.index = SearchIndex(titles)
+        if self.stopping:
+            return
+        self.index_ready.emit(titles, self.index)
+
+        while True:
+            with self.condition:
+                while self.pending is None and not self.stopping:
+                    self.condition.wait()
+                if self.stopping:
+                    return
+                generation, query, within = self.pending
+                self.pending = None
+            with tracing.span("search.query", refine=within is not None):
+                matches = self.index.search(query, within=within)
+            self.results_ready.emit(generation, query, matches)
+
 class GameSearchApp(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -53,13 +252,40 @@ class GameSearchApp(QMainWindow):
         self.layout = QVBoxLayout()
         self.central_widget.setLayout(self.layout)
 
+        self.image_loader = ImageLoader(max_workers=4,
+                                        disk_cache=DiskCache('image_cache', max_bytes=256 * 1024 * 1024),
+                                        memory_cache=PixmapCache(max_bytes=64 * 1024 * 1024),
+                                        parent=self)
+
         self.setup_ui()
 
-        self.json_file = 'game_list.json'
-        self.games = self.load_game_list(self.json_file)
-        self.populate_game_list()
+        # Filled in by load_catalog once the window has been painted
+        self.catalog_file = 'game_list.db'
+        self.catalog = None
+        self.titles = []
+        self.search_index = None
+        self.search_thread = None
+        self.search_generation = 0
+        self.search_base = None     # (query, matches) of the last title search, refined by the next one
+        self.search_matches = None
+        self.pending_rows = []
+        self.pending_start = 0
+        self.spec_orders = {}
+        self.first_paint_ms = None
+        self.catalog_ready_ms = None
+
+        self.library = Library('library.json')
+        self.library_thread = None
+        self.update_thread = None
+        self.library_rescan_needed = False
 
         self.download_thread = None
+        self.extract_thread = None
+        self.verify_thread = None
+        # One operation on a game at a time: a download + extraction, or a verify
+        self.installing = False
+        self.verifying = False
+        self.installing_game = None     # title being downloaded / extracted
         self.current_game = None
         self.captcha_key = None
 
@@ -69,21 +295,50 @@ class GameSearchApp(QMainWindow):
         self.captcha_key_button.clicked.connect(self.set_captcha_key)
         self.layout.addWidget(self.captcha_key_button)
 
+        self.update_button = QPushButton("Update Database")
+        self.update_button.setEnabled(False)
+        self.update_button.clicked.connect(self.update_catalog)
+        self.layout.addWidget(self.update_button)
+
         # Search bar
         self.search_layout = QHBoxLayout()
         self.search_input = QLineEdit()
-        self.search_input.setPlaceholderText("Search for games...")
+        self.search_input.setPlaceholderText("Loading game catalog...")
+        self.search_input.setEnabled(False)
         self.search_layout.addWidget(self.search_input)
 
         # Drive selection
         self.drive_combo = QComboBox()
         self.drive_combo.addItems(self.get_available_drives())
         self.search_layout.addWidget(self.drive_combo)
+        self.drive_info = QLabel()
+        self.search_layout.addWidget(self.drive_info)
+        self.drive_combo.currentTextChanged.connect(self.update_drive_info)
+
+        # Sorting / filtering on the typed catalog fields
+        self.sort_combo = QComboBox()
+        self.sort_combo.addItems([label for label, _, _ in SORT_OPTIONS])
+        self.search_layout.addWidget(self.sort_combo)
+        self.fits_checkbox = QCheckBox("Fits on drive")
+        self.fits_checkbox.setToolTip("Only show games whose stated size fits in the free space of the selected drive")
+        self.search_layout.addWidget(self.fits_checkbox)
+        self.sort_combo.currentIndexChanged.connect(self.apply_view)
+        self.fits_checkbox.toggled.connect(self.apply_view)
+        self.drive_combo.currentTextChanged.connect(self.apply_view)
 
         # Game list and info
         self.splitter = QSplitter(Qt.Horizontal)
-        self.game_list = QListWidget()
+        self.game_model = GameListModel()
+        self.game_proxy = GameFilterProxy()
+        self.game_proxy.setSourceModel(self.game_model)
+        self.game_list = QListView()
+        self.game_list.setModel(self.game_proxy)
         self.game_list.setFrameShape(QFrame.StyledPanel)
+        self.game_list.setEditTriggers(QListView.NoEditTriggers)
+        # Same-height rows + batched layout: only the visible rows ever get measured/painted
+        self.game_list.setUniformItemSizes(True)
+        self.game_list.setLayoutMode(QListView.Batched)
+        self.game_list.setBatchSize(256)
         
         self.info_scroll = QScrollArea()
         self.info_scroll.setWidgetResizable(True)
@@ -102,6 +357,20 @@ class GameSearchApp(QMainWindow):
         self.screenshots_layout = QHBoxLayout()
         self.info_layout.addLayout(self.screenshots_layout)
         
+        self.install_label = QLabel()
+        self.install_label.setVisible(False)
+        self.info_layout.addWidget(self.install_label)
+
+        self.verify_button = QPushButton("Verify Installation")
+        self.verify_button.setVisible(False)
+        self.verify_button.clicked.connect(self.verify_installation)
+        self.info_layout.addWidget(self.verify_button)
+
+        self.verify_progress = QProgressBar()
+        self.verify_progress.setFormat("Verifying... %p%")
+        self.verify_progress.setVisible(False)
+        self.info_layout.addWidget(self.verify_progress)
+
         self.download_button = QPushButton("Download and Install Game")
         self.download_button.clicked.connect(self.download_game)
         self.info_layout.addWidget(self.download_button)
@@ -109,6 +378,10 @@ class GameSearchApp(QMainWindow):
         self.progress_bar = QProgressBar()
         self.progress_bar.setVisible(False)
         self.info_layout.addWidget(self.progress_bar)
+
+        self.status_label = QLabel()
+        self.status_label.setVisible(False)
+        self.info_layout.addWidget(self.status_label)
         
         self.info_scroll.setWidget(self.info_widget)
         
@@ -121,8 +394,36 @@ class GameSearchApp(QMainWindow):
         self.layout.addWidget(self.splitter)
 
         # Connect signals
-        self.search_input.textChanged.connect(self.filter_games)
-        self.game_list.itemClicked.connect(self.show_game_info)
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(SEARCH_DEBOUNCE_MS)
+        self.search_timer.timeout.connect(self.filter_games)
+        self.search_input.textChanged.connect(lambda _: self.search_timer.start())
+        self.stream_timer = QTimer(self)
+        self.stream_timer.setInterval(0)
+        self.stream_timer.timeout.connect(self.stream_rows)
+
+        # Performance panel (Ctrl+Shift+P): span timings and counters collected by tracing
+        self.stats_text = QPlainTextEdit()
+        self.stats_text.setReadOnly(True)
+        self.stats_text.setFont(QFontDatabase.systemFont(QFontDatabase.FixedFont))
+        self.export_trace_button = QPushButton("Export Trace")
+        self.export_trace_button.clicked.connect(self.export_trace)
+        stats_widget = QWidget()
+        stats_layout = QVBoxLayout(stats_widget)
+        stats_layout.addWidget(self.stats_text)
+        stats_layout.addWidget(self.export_trace_button)
+        self.stats_dock = QDockWidget("Performance", self)
+        self.stats_dock.setWidget(stats_widget)
+        self.addDockWidget(Qt.RightDockWidgetArea, self.stats_dock)
+        self.stats_dock.hide()
+        self.stats_timer = QTimer(self)
+        self.stats_timer.setInterval(1000)
+        self.stats_timer.timeout.connect(self.refresh_stats)
+        self.stats_dock.visibilityChanged.connect(
+            lambda visible: self.stats_timer.start() if visible else self.stats_timer.stop())
+        QShortcut(QKeySequence("Ctrl+Shift+P"), self, activated=self.toggle_stats)
+        self.game_list.clicked.connect(self.show_game_info)
 
     def get_available_drives(self):
         return [f"{d}:" for d in "CDEFGHIJKLMNOPQRSTUVWXYZ" if os.path.exists(f"{d}:")]
@@ -133,65 +434,337 @@ class GameSearchApp(QMainWindow):
             self.captcha_key = key
             QMessageBox.information(self, "API Key Set", "2Captcha API key has been set successfully.")
 
-    @staticmethod
-    def load_game_list(json_file):
-        if os.path.exists(json_file):
-            with open(json_file, 'r') as file:
-                return json.load(file)
-        else:
-            return {}
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if self.first_paint_ms is None:
+            self.first_paint_ms = (time.perf_counter() - STARTUP_T0) * 1000
+            status = "within" if self.first_paint_ms <= STARTUP_BUDGET_MS else "OVER"
+            print(f"First paint after {self.first_paint_ms:.0f} ms ({status} the {STARTUP_BUDGET_MS} ms budget)")
+            QTimer.singleShot(0, self.load_catalog)
+
+    @tracing.traced("catalog.load")
+    def load_catalog(self):
+        from GameList.catalog import open_catalog
+        self.catalog = open_catalog(self.catalog_file, legacy_json_file='game_list.json')
+        self.search_thread = SearchThread(self.catalog_file)
+        self.search_thread.index_ready.connect(self.catalog_ready)
+        self.search_thread.results_ready.connect(self.search_finished)
+        self.search_thread.start()
+
+        # Installed games: show the last known state right away, then refresh it in the background
+        self.library.load()
+        self.update_drive_info()
+        self.scan_library()
+
+    def catalog_ready(self, titles, index):
+        self.titles = titles
+        self.search_index = index
+        self.populate_game_list()
+
+        self.search_input.setPlaceholderText("Search for games...")
+        self.search_input.setEnabled(True)
+        self.update_button.setEnabled(True)
+        self.catalog_ready_ms = (time.perf_counter() - STARTUP_T0) * 1000
+        print(f"Catalog of {len(self.titles)} games ready after {self.catalog_ready_ms:.0f} ms")
+
+    def scan_library(self, paths=None):
+        if self.library_thread and self.library_thread.isRunning():
+            self.library_rescan_needed = True
+            return
+        jobs = self.library.scan_jobs(paths)
+        if not jobs:
+            return
+        self.library_thread = LibraryScanThread(jobs)
+        self.library_thread.scan_complete.connect(self.library_scanned)
+        self.library_thread.start()
+
+    def library_scanned(self, entries):
+        self.library.apply_scan(entries)
+        self.update_drive_info()
+        self.update_install_info()
+        if self.library_rescan_needed:
+            self.library_rescan_needed = False
+            self.scan_library()
+
+    def update_drive_info(self):
+        drive = self.drive_combo.currentText()
+        if not drive:
+            self.drive_info.clear()
+            return
+        summary = self.library.drive_summary(drive)
+        text = f"{summary['installed']} installed, {format_size(summary['size'])} on disk"
+        if summary['free'] is not None:
+            text += f", {format_size(summary['free'])} free"
+        self.drive_info.setText(text)
+
+    def update_install_info(self):
+        path, entry = self.library.find(self.current_game) if self.current_game else (None, None)
+        if entry is None:
+            self.install_label.setVisible(False)
+            self.verify_button.setVisible(False)
+            return
+        self.install_label.setText(f"Installed at {path} ({format_size(entry['size'])}, {entry['files']} files)")
+        self.install_label.setVisible(True)
+        self.verify_button.setVisible(True)
+
+    def update_action_buttons(self):
+        busy = self.installing or self.verifying
+        self.download_button.setEnabled(not busy)
+        self.verify_button.setEnabled(not busy)
+
+    def verify_installation(self):
+        path, entry = self.library.find(self.current_game)
+        if entry is None or self.installing or self.verifying:
+            return
+        self.verify_thread = VerifyThread(path)
+        self.verify_thread.progress_update.connect(self.verify_progress.setValue)
+        self.verify_thread.verify_complete.connect(self.verification_finished)
+        self.verify_thread.verify_error.connect(self.verification_error)
+
+        self.verifying = True
+        self.verify_progress.setValue(0)
+        self.verify_progress.setVisible(True)
+        self.update_action_buttons()
+        self.verify_thread.start()
+
+    def reset_verify(self):
+        # Leaves the download progress and status alone, an install may be showing there
+        self.verifying = False
+        self.verify_progress.setVisible(False)
+        self.update_action_buttons()
+
+    def verification_finished(self, install_path, report):
+        self.reset_verify()
+        if report["ok"]:
+            QMessageBox.information(self, "Installation OK",
+                                    f"All {report['files']} files of {install_path} are intact "
+                                    f"({report['verified']} hashed, {report['skipped']} unchanged since extraction).")
+            return
+        problems = [f"Missing: {rel}" for rel in report["missing"]] + [f"Corrupt: {rel}" for rel in report["corrupt"]]
+        details = "\n".join(problems[:10])
+        if len(problems) > 10:
+            details += f"\n... and {len(problems) - 10} more"
+        QMessageBox.warning(self, "Installation Damaged",
+                            f"{len(report['missing'])} missing and {len(report['corrupt'])} corrupt files "
+                            f"in {install_path}. Reinstall the game to repair it.\n\n{details}")
+
+    def verification_error(self, error_message):
+        self.reset_verify()
+        QMessageBox.critical(self, "Verification Error", f"Could not verify the installation: {error_message}")
 
     def populate_game_list(self):
-        self.game_list.clear()
-        for game in sorted(self.games.keys()):
-            self.game_list.addItem(game)
+        self.game_model.set_titles(self.titles)
+
+    def update_catalog(self):
+        reply = QMessageBox.question(self, "Update Database",
+                                     "The database of games has to be updated every few days to get the latest "
+                                     "content. It can take up to 30 minutes. Update it now?",
+                                     QMessageBox.Yes | QMessageBox.No)
+        if reply != QMessageBox.Yes:
+            return
+        self.update_button.setEnabled(False)
+        self.update_button.setText("Updating Database...")
+        self.update_thread = CatalogUpdateThread(self.catalog_file)
+        self.update_thread.update_complete.connect(self.catalog_updated)
+        self.update_thread.update_error.connect(self.catalog_update_error)
+        self.update_thread.start()
+
+    def catalog_updated(self, delta):
+        self.update_button.setEnabled(True)
+        self.update_button.setText("Update Database")
+        self.apply_catalog_delta(delta)
+        QMessageBox.information(self, "Database Updated",
+                                f"{len(delta['added'])} games added, {len(delta['changed'])} changed "
+                                f"and {len(delta['removed'])} removed.")
+
+    def catalog_update_error(self, error_message):
+        self.update_button.setEnabled(True)
+        self.update_button.setText("Update Database")
+        QMessageBox.critical(self, "Update Error", f"Could not update the database: {error_message}")
+
+    @tracing.traced("catalog.apply_delta")
+    def apply_catalog_delta(self, delta):
+        # Only the titles that changed touch the model and the index, rows are inserted and
+        # removed in place so the view never reloads the whole catalog
+        for title in delta['removed']:
+            self.search_index.remove(title)
+            self.game_model.remove_title(title)
+            row = bisect.bisect_left(self.titles, title)
+            if row < len(self.titles) and self.titles[row] == title:
+                del self.titles[row]
+        for title in delta['added']:
+            title = sys.intern(title)
+            self.search_index.add(title)
+            self.game_model.insert_title(title)
+            row = bisect.bisect_left(self.titles, title)
+            if row == len(self.titles) or self.titles[row] != title:
+                self.titles.insert(row, title)
+        if not (delta['added'] or delta['changed'] or delta['removed']):
+            return
+        # Sizes and dates may have moved, the orders are read again when next needed
+        self.spec_orders = {}
+        _, field, _ = SORT_OPTIONS[self.sort_combo.currentIndex()]
+        if self.search_matches is not None or field is not None or self.fits_checkbox.isChecked():
+            self.search_base = None
+            self.filter_games()
+        if self.current_game in delta['changed']:
+            index = self.game_proxy.mapFromSource(self.game_model.index(self.game_model.row_of(self.current_game)))
+            if index.isValid():
+                self.show_game_info(index)
 
     def filter_games(self):
-        search_term = self.search_input.text().lower()
-        for i in range(self.game_list.count()):
-            item = self.game_list.item(i)
-            item.setHidden(search_term not in item.text().lower())
-
-    def show_game_info(self, item):
-        game_name = item.text()
+        if self.search_index is None:
+            return
+        # Anything still in flight is for an older query and will be ignored
+        self.search_generation += 1
+        query = normalize(self.search_input.text())
+        if not query:
+            self.search_base = None
+            self.search_matches = None
+            self.apply_view()
+            return
+        within = None
+        if self.search_base and can_refine(*self.search_base, query):
+            # One more character typed: only the previous matches can still match
+            within = self.search_base[1]
+        self.search_thread.submit(self.search_generation, query, within)
+
+    def search_finished(self, generation, query, matches):
+        if generation != self.search_generation:
+            return
+        self.search_base = (query, matches)
+        if matches == []:
+            # Nothing in the titles, fall back to the full-text index over descriptions
+            with tracing.span("search.full_text"):
+                matches = self.catalog.search_text(query)
+        self.search_matches = matches
+        self.apply_view()
+
+    def spec_order(self, field):
+        # (values, titles) sorted by a typed field, read once from the catalog's index
+        if field not in self.spec_orders:
+            self.spec_orders[field] = self.catalog.sorted_by(field)
+        return self.spec_orders[field]
+
+    def fitting_titles(self):
+        free = self.library.drive_summary(self.drive_combo.currentText())['free'] if self.drive_combo.currentText() else None
+        if free is None:
+            return set()
+        values, titles = self.spec_order('install_gb')
+        return set(titles[:bisect.bisect_right(values, free / 1024 ** 3)])
+
+    @tracing.traced("view.apply")
+    def apply_view(self, *args):
+        if self.search_index is None:
+            return
+        matches = self.search_matches
+        _, field, descending = SORT_OPTIONS[self.sort_combo.currentIndex()]
+        allowed = self.fitting_titles() if self.fits_checkbox.isChecked() else None
+
+        if field is None:
+            if allowed is None:
+                rows = matches
+            elif matches is None:
+                rows = sorted(allowed)
+            else:
+                rows = [title for title in matches if title in allowed]
+        else:
+            _, ordered = self.spec_order(field)
+            if descending:
+                ordered = ordered[::-1]
+            candidates = self.titles if matches is None else matches
+            keep = None if matches is None else set(matches)
+            rows = [title for title in ordered
+                    if (keep is None or title in keep) and (allowed is None or title in allowed)]
+            # Games whose text didn't say go last, in their current order
+            if allowed is None:
+                known = set(ordered)
+                rows += [title for title in candidates if title not in known]
+        # Only these rows are mapped into the view, nothing is re-parsed or re-queried
+        self.show_rows(rows)
+
+    def show_rows(self, rows):
+        self.stream_timer.stop()
+        self.pending_rows = []
+        if rows is None or len(rows) <= STREAM_FIRST_ROWS:
+            self.game_proxy.set_titles(rows)
+            return
+        # The first screenful shows up at once, the rest is appended between events so
+        # the next keystroke doesn't wait behind a long result
+        self.game_proxy.set_titles(rows[:STREAM_FIRST_ROWS])
+        self.pending_rows = rows
+        self.pending_start = STREAM_FIRST_ROWS
+        self.stream_timer.start()
+
+    @tracing.traced("view.stream_chunk")
+    def stream_rows(self):
+        end = self.pending_start + STREAM_CHUNK_ROWS
+        self.game_proxy.append_titles(self.pending_rows[self.pending_start:end])
+        self.pending_start = end
+        if end >= len(self.pending_rows):
+            self.stream_timer.stop()
+            self.pending_rows = []
+
+    @tracing.traced("ui.show_game_info")
+    def show_game_info(self, index):
+        game_name = index.data()
         self.current_game = game_name
-        game_info = self.games[game_name]
+        game_info = self.catalog.get(game_name)
+
+        # Drop the images still loading for the previously selected game
+        self.image_loader.cancel()
 
         # Set game image
-        pixmap = QPixmap()
-        pixmap.loadFromData(requests.get(game_info['banner_url']).content)
-        self.game_image.setPixmap(pixmap.scaled(300, 300, Qt.KeepAspectRatio, Qt.SmoothTransformation))
         self.game_image.setMaximumSize(300, 300)
+        self.show_placeholder(self.game_image)
+        if game_info['banner_url']:
+            self.load_image_into(self.game_image, game_info['banner_url'], (300, 300))
 
         # Prepare info text
         info_text = f"<h2>{game_name}</h2>"
         info_text += f"<p>{game_info['text_content']}</p>"
         info_text += "<h3>System Requirements:</h3><pre>{}</pre>".format(game_info['system_requirements'])
         info_text += "<h3>Game Info:</h3><pre>{}</pre>".format(game_info['game_info'])
+        specs = []
+        if game_info['ram_gb'] is not None:
+            specs.append(f"RAM: {game_info['ram_gb']:g} GB")
+        if game_info['install_gb'] is not None:
+            specs.append(f"Disk: {game_info['install_gb']:g} GB")
+        if game_info['gpu_tier'] is not None:
+            specs.append(f"GPU: {GPU_TIERS[game_info['gpu_tier']]}")
+        if game_info['release_date']:
+            specs.append(f"Released: {game_info['release_date']}")
+        if specs:
+            info_text += "<p><b>{}</b></p>".format(" | ".join(specs))
 
         self.info_text.setHtml(info_text)
+        self.update_install_info()
 
         # Clear previous screenshots
         for i in reversed(range(self.screenshots_layout.count())): 
             self.screenshots_layout.itemAt(i).widget().setParent(None)
 
-        # Load and display screenshots
+        # Load and display screenshots in the background
         for screenshot_url in game_info['screenshots'][:4]:  # Limit to 4 screenshots
-            try:
-                response = requests.get(screenshot_url)
-                response.raise_for_status()
-                img_data = BytesIO(response.content)
-                pixmap = QPixmap()
-                pixmap.loadFromData(img_data.getvalue())
-                scaled_pixmap = pixmap.scaled(200, 200, Qt.KeepAspectRatio, Qt.SmoothTransformation)
-                label = QLabel()
-                label.setPixmap(scaled_pixmap)
-                label.setAlignment(Qt.AlignCenter)
-                self.screenshots_layout.addWidget(label)
-            except Exception as e:
-                print(f"Error loading screenshot: {e}")
+            label = QLabel()
+            label.setAlignment(Qt.AlignCenter)
+            label.setMinimumSize(200, 112)
+            self.show_placeholder(label)
+            self.screenshots_layout.addWidget(label)
+            self.load_image_into(label, screenshot_url, (200, 200))
+
+    @staticmethod
+    def show_placeholder(label):
+        label.clear()
+        label.setText("Loading image...")
+
+    def load_image_into(self, label, url, size):
+        self.image_loader.load(url, size, label.setPixmap,
+                               lambda error: label.setText("Image unavailable"))
 
     def download_game(self):
+        if self.installing or self.verifying:
+            return
         if not self.captcha_key:
             QMessageBox.warning(self, "No Captcha Key", "Please set your 2Captcha API key before downloading.")
             return
@@ -205,13 +778,14 @@ class GameSearchApp(QMainWindow):
             QMessageBox.warning(self, "No Drive Selected", "Please select a drive for download.")
             return
 
-        game_info = self.games[self.current_game]
+        game_info = self.catalog.get(self.current_game)
         megadb_url = self.get_megadb_link(game_info)
         if not megadb_url:
             QMessageBox.warning(self, "No MegaDB Link", "No MegaDB download link available for this game.")
             return
 
         try:
+            import megadbdl  # pulls in selenium, only needed once a download starts
             download_url = megadbdl.retrieve_download_url(self.captcha_key, megadb_url)
         except Exception as e:
             QMessageBox.critical(self, "Download Error", f"Failed to retrieve download URL: {str(e)}")
@@ -219,15 +793,23 @@ class GameSearchApp(QMainWindow):
 
         game_folder = os.path.join(selected_drive, self.current_game)
         os.makedirs(game_folder, exist_ok=True)
+        # Registered in the library once extraction succeeds, a failed install isn't installed
+        self.installing_game = self.current_game
         save_path = os.path.join(game_folder, f"{self.current_game}.zip")
 
         self.download_thread = DownloadThread(download_url, save_path)
         self.download_thread.progress_update.connect(self.update_progress)
+        self.download_thread.stats_update.connect(self.update_download_stats)
         self.download_thread.download_complete.connect(self.download_finished)
         self.download_thread.download_error.connect(self.download_error)
 
+        self.progress_bar.setValue(0)
+        self.progress_bar.setFormat("Downloading... %p%")
         self.progress_bar.setVisible(True)
-        self.download_button.setEnabled(False)
+        self.status_label.setText("Starting download...")
+        self.status_label.setVisible(True)
+        self.installing = True
+        self.update_action_buttons()
         self.download_thread.start()
 
     def get_megadb_link(self, game_info):
@@ -241,23 +823,56 @@ class GameSearchApp(QMainWindow):
     def update_progress(self, value):
         self.progress_bar.setValue(value)
 
+    def update_download_stats(self, downloaded, total, speed, eta):
+        text = f"{format_size(speed)}/s  -  {format_size(downloaded)}"
+        if total > 0:
+            text += f" of {format_size(total)}"
+        if eta >= 0:
+            text += f"  -  {format_duration(eta)} left"
+        self.status_label.setText(text)
+
     def download_finished(self, save_path):
-        self.progress_bar.setVisible(False)
-        self.download_button.setEnabled(True)
-        
-        try:
-            self.extract_and_run(save_path)
-            QMessageBox.information(self, "Installation Complete", f"Game installed successfully to {os.path.dirname(save_path)}")
-        except Exception as e:
-            QMessageBox.critical(self, "Installation Error", f"An error occurred during installation: {str(e)}")
+        self.extract_and_run(save_path)
 
     def extract_and_run(self, zip_path):
+        # Extraction runs in a worker thread, the redistributables are launched once it's done
         extract_path = os.path.dirname(zip_path)
-        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-            zip_ref.extractall(extract_path)
-        
-        os.remove(zip_path)  # Remove the zip file after extraction
-        
+        self.extract_thread = ExtractThread(zip_path, extract_path)
+        self.extract_thread.progress_update.connect(self.update_progress)
+        self.extract_thread.member_progress.connect(self.update_extract_status)
+        self.extract_thread.extract_complete.connect(self.extraction_finished)
+        self.extract_thread.extract_error.connect(self.extraction_error)
+
+        self.progress_bar.setValue(0)
+        self.progress_bar.setFormat("Extracting... %p%")
+        self.progress_bar.setVisible(True)
+        self.status_label.setVisible(True)
+        self.installing = True
+        self.update_action_buttons()
+        self.extract_thread.start()
+
+    def update_extract_status(self, member, done, total):
+        self.status_label.setText(f"Extracting {member}")
+
+    def extraction_finished(self, extract_path):
+        self.reset_progress()
+        self.library.register(self.installing_game, extract_path)
+        self.scan_library([extract_path])
+        self.run_redist(extract_path)
+        QMessageBox.information(self, "Installation Complete", f"Game installed successfully to {extract_path}")
+
+    def extraction_error(self, error_message):
+        self.reset_progress()
+        QMessageBox.critical(self, "Installation Error", f"An error occurred during installation: {error_message}")
+
+    def reset_progress(self):
+        self.installing = False
+        self.progress_bar.setVisible(False)
+        self.progress_bar.setFormat("%p%")
+        self.status_label.setVisible(False)
+        self.update_action_buttons()
+
+    def run_redist(self, extract_path):
         redist_folder = os.path.join(extract_path, "_Redist")
         if os.path.exists(redist_folder):
             for file in os.listdir(redist_folder):
@@ -266,10 +881,53 @@ class GameSearchApp(QMainWindow):
                     os.startfile(full_path)
 
     def download_error(self, error_message):
-        self.progress_bar.setVisible(False)
-        self.download_button.setEnabled(True)
+        self.reset_progress()
         QMessageBox.critical(self, "Download Error", f"An error occurred during download: {error_message}")
 
+    def toggle_stats(self):
+        self.stats_dock.setVisible(not self.stats_dock.isVisible())
+        self.refresh_stats()
+
+    def refresh_stats(self):
+        current = tracing.stats()
+        lines = [f"{'span':<22}{'count':>7}{'total ms':>11}{'mean ms':>10}{'max ms':>10}"]
+        for name, span in sorted(current['spans'].items(), key=lambda item: -item[1]['total_ms']):
+            lines.append(f"{name:<22}{span['count']:>7}{span['total_ms']:>11.1f}"
+                         f"{span['mean_ms']:>10.2f}{span['max_ms']:>10.1f}")
+        if current['counters']:
+            lines.append("")
+            for name, value in sorted(current['counters'].items()):
+                lines.append(f"{name:<22}{value:>7}")
+        self.stats_text.setPlainText("\n".join(lines))
+
+    def export_trace(self):
+        path, _ = QFileDialog.getSaveFileName(self, "Export Trace", "trace.json", "Chrome trace (*.json)")
+        if path:
+            events = tracing.export_chrome_trace(path)
+            QMessageBox.information(self, "Trace Exported",
+                                    f"{events} events written to {path}.\n"
+                                    "Open it in chrome://tracing or https://ui.perfetto.dev.")
+
+    def closeEvent(self, event):
+        # Don't leave a half-written game folder behind a still-running extraction
+        if self.extract_thread and self.extract_thread.isRunning():
+            self.extract_thread.requestInterruption()
+            self.extract_thread.wait()
+        if self.library_thread and self.library_thread.isRunning():
+            self.library_thread.wait()
+        if self.verify_thread and self.verify_thread.isRunning():
+            self.verify_thread.wait()
+        if self.search_thread:
+            self.search_thread.stop()
+            self.search_thread.wait()
+        # Image tasks still running would emit into a deleted loader, stop and wait for them
+        self.image_loader.cancel()
+        self.image_loader.pool.waitForDone()
+        if self.update_thread and self.update_thread.isRunning():
+            # The catalog is written in a single transaction, but the scrape can't be interrupted
+            self.update_thread.wait()
+        super().closeEvent(event)
+
 def main():
     app = QApplication(sys.argv)
     window = GameSearchApp()
@@ -277,13 +935,7 @@ def main():
     sys.exit(app.exec_())
 
 if __name__ == "__main__":
-    string = "The DataBase of games, has to bee updated every few days to make sure to get the updated content \nWould you like to update it, it can take up to 30min to fully update the DB"
-    print(string)
-    choice = input('\n\n ( Y / N ):  ')
-    if choice.upper() == "Y":
-        from GameList.main import start_script
-        start_script()
-        shutil.move('GameList\\cleaned_results.json','game_list.json')
+    # The database is updated from the "Update Database" button, in place and in the background
     main()
 
 print("Game Downloader application started successfully.")
\ No newline at end of file
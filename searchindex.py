@@ -0,0 +1,273 @@
+import bisect
+import itertools
+import re
+import threading
+from array import array
+from collections import Counter, defaultdict
+
+# Words are runs of letters/digits, everything else (":", "-", "'", ...) is a separator
+TOKEN_RE = re.compile(r"[^\W_]+")
+
+# Ranking tiers, lower is better
+EXACT, TITLE_PREFIX, WORD_PREFIX, SUBSTRING, ALL_WORDS, FUZZY = range(6)
+
+# Share of the query trigrams a title must contain to count as a typo match
+FUZZY_THRESHOLD = 0.5
+# Typo matching kicks in below this many exact hits (and needs a query of 5+ chars)
+FUZZY_MIN_RESULTS = 20
+FUZZY_MIN_TRIGRAMS = 3
+# Query words with more vocabulary continuations than this are refined through a set
+REFINE_MAX_CONTINUATIONS = 8
+
+
+def normalize(text):
+    return " ".join(text.lower().split())
+
+
+def tokenize(text):
+    return TOKEN_RE.findall(text)
+
+
+def trigrams(text):
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def can_refine(previous_query, previous_matches, query):
+    """Whether `query` may be searched within the matches of `previous_query`.
+
+    Holds when the query extends the previous one and the previous one has a
+    word: without a word it had no all-words matches to narrow down from.
+    An empty previous result is never refined, a full search is as cheap.
+    """
+    previous_query = normalize(previous_query)
+    return bool(previous_matches) and bool(tokenize(previous_query)) and normalize(query).startswith(previous_query)
+
+
+def _postings():
+    # Ids are handed out in increasing order, so appending keeps every posting list sorted
+    return array('I')
+
+
+def _has(postings, game_id):
+    position = bisect.bisect_left(postings, game_id)
+    return position < len(postings) and postings[position] == game_id
+
+
+def _discard(postings, game_id):
+    position = bisect.bisect_left(postings, game_id)
+    if position < len(postings) and postings[position] == game_id:
+        del postings[position]
+
+
+class SearchIndex:
+    """In-memory title index with token and trigram postings.
+
+    Every posting list holds ids of titles, so a query only touches the
+    titles that share something with it instead of scanning the catalog.
+    Postings are sorted arrays of 4-byte ids rather than sets, which keeps
+    the index of a 100k-game catalog at a fraction of the memory.
+    """
+
+    def __init__(self, titles=()):
+        self._lock = threading.RLock()
+        self._titles = []               # id -> title, None once removed
+        self._lowered = []              # id -> normalized title
+        self._ids = {}                  # title -> id
+        self._tokens = defaultdict(_postings)     # word -> sorted ids
+        self._trigrams = defaultdict(_postings)   # trigram -> sorted ids
+        self._vocab = []                # sorted words, used for prefix ranges
+        for title in titles:
+            self._index(title)
+        self._vocab = sorted(self._tokens)
+
+    def __len__(self):
+        return len(self._ids)
+
+    def __contains__(self, title):
+        return title in self._ids
+
+    def _index(self, title):
+        if title in self._ids:
+            return []
+        game_id = len(self._titles)
+        lowered = normalize(title)
+        self._titles.append(title)
+        self._lowered.append(lowered)
+        self._ids[title] = game_id
+
+        new_words = []
+        for word in set(tokenize(lowered)):
+            if word not in self._tokens:
+                new_words.append(word)
+            self._tokens[word].append(game_id)
+        for gram in trigrams(lowered):
+            self._trigrams[gram].append(game_id)
+        return new_words
+
+    def add(self, title):
+        with self._lock:
+            for word in self._index(title):
+                bisect.insort(self._vocab, word)
+
+    def remove(self, title):
+        with self._lock:
+            game_id = self._ids.pop(title, None)
+            if game_id is None:
+                return
+            lowered = self._lowered[game_id]
+            for word in set(tokenize(lowered)):
+                postings = self._tokens[word]
+                _discard(postings, game_id)
+                if not postings:
+                    del self._tokens[word]
+                    del self._vocab[bisect.bisect_left(self._vocab, word)]
+            for gram in trigrams(lowered):
+                postings = self._trigrams[gram]
+                _discard(postings, game_id)
+                if not postings:
+                    del self._trigrams[gram]
+            # Ids are never reused, the slot just goes dead
+            self._titles[game_id] = None
+            self._lowered[game_id] = None
+
+    def _words_with_prefix(self, prefix):
+        start = bisect.bisect_left(self._vocab, prefix)
+        for word in self._vocab[start:]:
+            if not word.startswith(prefix):
+                break
+            yield word
+
+    def _prefix_ids(self, prefix):
+        ids = set()
+        for word in self._words_with_prefix(prefix):
+            ids.update(self._tokens[word])
+        return ids
+
+    def _substring_ids(self, query):
+        if len(query) >= 3:
+            # A title containing the query contains all of its trigrams: start from the
+            # rarest one and probe the others by binary search
+            postings = sorted((self._trigrams.get(gram) for gram in trigrams(query)), key=lambda ids: len(ids or ()))
+            if not postings[0]:
+                return set()
+            candidates = set(postings[0])
+            for other in postings[1:]:
+                candidates = {game_id for game_id in candidates if _has(other, game_id)}
+                if not candidates:
+                    break
+        elif TOKEN_RE.fullmatch(query):
+            # Too short for trigrams, go through the (much smaller) vocabulary instead
+            candidates = set()
+            for word, ids in self._tokens.items():
+                if query in word:
+                    candidates.update(ids)
+        else:
+            # Punctuation or spaces never make it into a token, only the titles themselves have them
+            return {game_id for game_id, lowered in enumerate(self._lowered) if lowered is not None and query in lowered}
+        return {game_id for game_id in candidates if query in self._lowered[game_id]}
+
+    def _all_words_ids(self, words):
+        # Every query word must prefix some word of the title, in any order
+        postings = sorted((self._prefix_ids(word) for word in words), key=len)
+        ids = postings[0]
+        for other in postings[1:]:
+            ids &= other
+        return ids
+
+    def _fuzzy_ids(self, query):
+        grams = trigrams(query)
+        if len(grams) < FUZZY_MIN_TRIGRAMS:
+            return {}
+        counts = Counter()
+        for gram in grams:
+            counts.update(self._trigrams.get(gram, ()))
+        needed = len(grams) * FUZZY_THRESHOLD
+        return {game_id: hits / len(grams) for game_id, hits in counts.items() if hits >= needed}
+
+    def _tier(self, query, lowered):
+        if lowered == query:
+            return EXACT
+        if lowered.startswith(query):
+            return TITLE_PREFIX
+        position = lowered.find(query)
+        if position > 0:
+            return WORD_PREFIX if not lowered[position - 1].isalnum() else SUBSTRING
+        return ALL_WORDS
+
+    def _match(self, query, words):
+        ranked = {}
+        for game_id in self._substring_ids(query):
+            ranked[game_id] = (self._tier(query, self._lowered[game_id]), 0.0)
+        if words:
+            for game_id in self._all_words_ids(words):
+                ranked.setdefault(game_id, (ALL_WORDS, 0.0))
+        return ranked
+
+    def _word_tests(self, words):
+        # One membership test per query word: "some word of the title starts with it".
+        # A word with few continuations in the vocabulary probes their postings directly,
+        # a short one like "d" falls back to the union of its postings.
+        tests = []
+        for word in words:
+            continuations = list(itertools.islice(self._words_with_prefix(word), REFINE_MAX_CONTINUATIONS + 1))
+            if len(continuations) <= REFINE_MAX_CONTINUATIONS:
+                postings = [self._tokens[continuation] for continuation in continuations]
+                tests.append(lambda game_id, postings=postings: any(_has(ids, game_id) for ids in postings))
+            else:
+                tests.append(self._prefix_ids(word).__contains__)
+        return tests
+
+    def _refine(self, query, words, within):
+        # Whatever matches a query also matches every query it extends, so checking the
+        # earlier results is enough
+        ranked = {}
+        tests = None
+        for title in within:
+            game_id = self._ids.get(title)
+            if game_id is None:
+                continue
+            lowered = self._lowered[game_id]
+            if query in lowered:
+                ranked[game_id] = (self._tier(query, lowered), 0.0)
+            elif words:
+                if tests is None:
+                    tests = self._word_tests(words)
+                if all(test(game_id) for test in tests):
+                    ranked[game_id] = (ALL_WORDS, 0.0)
+        return ranked
+
+    def _refine_pays(self, query, within):
+        # Refining checks every earlier match, a full search starts from its rarest trigram.
+        # Queries too short for trigrams scan the vocabulary, cheaper than checking titles.
+        if len(query) < 3:
+            return False
+        return len(within) < min(len(self._trigrams.get(gram, ())) for gram in trigrams(query))
+
+    def search(self, query, limit=None, within=None):
+        """Return matching titles, best first, or None for an empty query.
+
+        `within` may hold the full (unlimited) result of a query that this one
+        extends, e.g. "witc" after "wit"; only those titles are then checked.
+        Check can_refine() first, the result is only the same when it holds.
+        A full search is still run when it touches fewer postings than
+        `within` has titles.
+        """
+        query = normalize(query)
+        if not query:
+            return None
+        words = tokenize(query)
+
+        with self._lock:
+            if within is not None and not self._refine_pays(query, within):
+                within = None
+            ranked = self._match(query, words) if within is None else self._refine(query, words, within)
+
+            # Only go looking for typos when the exact matches come up short
+            if len(ranked) < (limit or FUZZY_MIN_RESULTS):
+                for game_id, similarity in self._fuzzy_ids(query).items():
+                    ranked.setdefault(game_id, (FUZZY, -similarity))
+
+            order = sorted(ranked, key=lambda game_id: (ranked[game_id], self._lowered[game_id]))
+            if limit is not None:
+                order = order[:limit]
+            return [self._titles[game_id] for game_id in order]
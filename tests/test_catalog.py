@@ -0,0 +1,23 @@
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from GameList.catalog import open_catalog  # noqa: E402
+
+
+def test_legacy_import_parses_specs(tmp_path):
+    legacy = tmp_path / "game_list.json"
+    legacy.write_text(json.dumps({"Some Game": {
+        "text_content": "About the game",
+        "system_requirements": "Memory: 8 GB RAM\nGraphics: NVIDIA GeForce GTX 1060\nStorage: 20 GB available space",
+        "game_info": "Game Size: 12 GB\nRelease Date: March 3, 2020",
+        "screenshots": [],
+        "downloads": [],
+    }}))
+    with open_catalog(str(tmp_path / "game_list.db"), legacy_json_file=str(legacy)) as store:
+        record = store.get("Some Game")
+        assert (record["ram_gb"], record["install_gb"], record["gpu_tier"]) == (8.0, 20.0, 3)
+        assert record["release_date"] == "2020-03-03"
+        assert list(store.sorted_by("ram_gb")[1]) == ["Some Game"]
@@ -0,0 +1,27 @@
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from GameList.jsonformater import iter_json_items  # noqa: E402
+
+DATA = {"t0 x": -2500.0, "t1": {"text_content": ["a", "b \"c\""], "n": 1e-3}, "t2": True, "t3": None,
+        "t4": [1, 2, 3], "t5": "plain", "t6": 12345}
+
+
+@pytest.mark.parametrize("indent", [None, 2])
+def test_items_survive_every_chunk_boundary(tmp_path, indent):
+    path = tmp_path / "scraped.json"
+    path.write_text(json.dumps(DATA, indent=indent))
+    for chunk_size in range(1, 40):
+        assert dict(iter_json_items(str(path), chunk_size=chunk_size)) == DATA, chunk_size
+
+
+def test_truncated_file_raises(tmp_path):
+    path = tmp_path / "scraped.json"
+    path.write_text(json.dumps(DATA)[:-10])
+    with pytest.raises((ValueError, IndexError)):
+        list(iter_json_items(str(path), chunk_size=7))
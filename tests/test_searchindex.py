@@ -0,0 +1,45 @@
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from searchindex import SearchIndex, can_refine  # noqa: E402
+
+WORDS = ("dark", "souls", "witcher", "hunt", "wild", "knight", "hollow", "half-life", "2:", ".hack//g.u.",
+         "remastered", "edition", "s.t.a.l.k.e.r.", "call", "duty", "ops", "n++", "deus ex", "hacknet", "3")
+
+
+def random_titles(rng, count):
+    return [" ".join(rng.sample(WORDS, rng.randint(1, 4))).title() + f" {number}" for number in range(count)]
+
+
+def test_short_queries_with_punctuation():
+    index = SearchIndex([".hack//G.U. Last Recode", "Hacknet", "Portal 2: Deluxe", "Portal 2"])
+    assert index.search(".") == [".hack//G.U. Last Recode"]
+    assert index.search("2:")[0] == "Portal 2: Deluxe"
+
+
+def test_refined_search_matches_full_search():
+    # Every prefix of a random query, typed one character at a time the way the GUI does
+    rng = random.Random(7)
+    titles = random_titles(rng, 3000)
+    index = SearchIndex(titles)
+    for _ in range(300):
+        title = rng.choice(titles).lower()
+        start = rng.randrange(len(title))
+        query = title[start:rng.randrange(start + 1, len(title) + 1)]
+        previous = None
+        for end in range(1, len(query) + 1):
+            typed = query[:end]
+            full = index.search(typed)
+            if previous and can_refine(previous[0], previous[1], typed):
+                assert index.search(typed, within=previous[1]) == full, (previous[0], typed)
+            previous = (typed, full)
+
+
+def test_empty_or_wordless_base_is_not_refined():
+    assert not can_refine(".", [], ".hac")
+    assert not can_refine(".", ["x"], ".hac")
+    assert not can_refine("zz", [], "zzz")
+    assert can_refine("wit", ["Witcher"], "witc")
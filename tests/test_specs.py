@@ -0,0 +1,25 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from GameList.specs import parse_specs  # noqa: E402
+
+
+@pytest.mark.parametrize("text, ram_gb", [
+    ("Memory: 8 GB RAM", 8.0),
+    ("Memory: 4,096 MB RAM", 4.0),
+    ("Memory: 1,5 GB RAM", 1.5),
+    ("Memory: 2,50 GB RAM", 2.5),
+    ("Memory: 512 MB RAM", 0.5),
+])
+def test_ram(text, ram_gb):
+    assert parse_specs(text, "")["ram_gb"] == ram_gb
+
+
+def test_thousands_separator_in_storage():
+    specs = parse_specs("Memory: 4,096 MB RAM\nStorage: 1,500 MB available space", "Game Size: 2,5 GB")
+    assert (specs["ram_gb"], specs["storage_gb"], specs["game_size_gb"]) == (4.0, 1.46, 2.5)
+    assert specs["install_gb"] == 2.5
@@ -0,0 +1,17 @@
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+
+pytest.importorskip("PyQt5")
+
+from bench import first_paint_ms  # noqa: E402
+
+
+def test_first_paint_within_budget(tmp_path):
+    # The catalog, requests and selenium must stay off the path to the first frame
+    paint, budget = first_paint_ms(str(tmp_path))
+    assert paint <= budget, f"first paint after {paint:.0f} ms, budget is {budget:.0f} ms"
@@ -0,0 +1,168 @@
+"""Named spans, counters and optional cProfile capture for the hot paths.
+
+    with tracing.span("catalog.load"):
+        ...
+
+    @tracing.traced("view.apply")
+    def apply_view(self): ...
+
+Every span is aggregated (count, total, max) for the stats panel and kept in a
+bounded buffer that export_chrome_trace() writes in the Chrome trace format,
+to be opened in chrome://tracing or https://ui.perfetto.dev.
+
+    STEAMRIP_TRACE=trace.json       write the trace there when the process exits
+    STEAMRIP_PROFILE=steamrip.prof  cProfile the main thread, dumped at exit
+"""
+import atexit
+import cProfile
+import functools
+import json
+import os
+import threading
+import time
+from collections import deque
+
+TRACE_ENV = "STEAMRIP_TRACE"
+PROFILE_ENV = "STEAMRIP_PROFILE"
+# Oldest events are dropped past this, the aggregated stats keep counting
+MAX_EVENTS = 200000
+
+_lock = threading.Lock()
+_events = deque(maxlen=MAX_EVENTS)  # (phase, name, start_ns, duration_ns or value, thread id, args)
+_spans = {}                         # name -> [count, total_ns, max_ns]
+_counters = {}                      # name -> value
+_thread_names = {}
+_origin_ns = time.perf_counter_ns()
+_profiler = None
+
+
+class _Span:
+    __slots__ = ("name", "args", "start")
+
+    def __init__(self, name, args):
+        self.name = name
+        self.args = args
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc_info):
+        record(self.name, self.start, time.perf_counter_ns(), self.args)
+
+
+def span(name, **args):
+    """Time a `with` block under `name`; keyword arguments end up in the trace."""
+    return _Span(name, args or None)
+
+
+def traced(name):
+    """Decorator form of span()."""
+    def decorate(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter_ns()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                record(name, start, time.perf_counter_ns())
+        return wrapper
+    return decorate
+
+
+def _thread():
+    thread = threading.get_ident()
+    if thread not in _thread_names:
+        _thread_names[thread] = threading.current_thread().name
+    return thread
+
+
+def record(name, start_ns, end_ns, args=None):
+    duration = end_ns - start_ns
+    thread = _thread()
+    with _lock:
+        stats = _spans.get(name)
+        if stats is None:
+            _spans[name] = [1, duration, duration]
+        else:
+            stats[0] += 1
+            stats[1] += duration
+            if duration > stats[2]:
+                stats[2] = duration
+        _events.append(("X", name, start_ns, duration, thread, args))
+
+
+def count(name, value=1):
+    thread = _thread()
+    with _lock:
+        total = _counters[name] = _counters.get(name, 0) + value
+        _events.append(("C", name, time.perf_counter_ns(), total, thread, None))
+
+
+def stats():
+    """{"spans": {name: {count, total_ms, mean_ms, max_ms}}, "counters": {name: value}}"""
+    with _lock:
+        spans = {
+            name: {"count": number, "total_ms": total / 1e6, "mean_ms": total / number / 1e6, "max_ms": longest / 1e6}
+            for name, (number, total, longest) in _spans.items()
+        }
+        return {"spans": spans, "counters": dict(_counters)}
+
+
+def reset():
+    with _lock:
+        _events.clear()
+        _spans.clear()
+        _counters.clear()
+
+
+def export_chrome_trace(path):
+    pid = os.getpid()
+    with _lock:
+        events = list(_events)
+        thread_names = dict(_thread_names)
+    trace = [{"name": "thread_name", "ph": "M", "pid": pid, "tid": thread, "args": {"name": name}}
+             for thread, name in thread_names.items()]
+    for phase, name, start, value, thread, args in events:
+        event = {"name": name, "cat": name.split(".", 1)[0], "ph": phase, "pid": pid, "tid": thread,
+                 "ts": (start - _origin_ns) / 1000}
+        if phase == "X":
+            event["dur"] = value / 1000
+            if args:
+                event["args"] = args
+        else:
+            event["args"] = {name: value}
+        trace.append(event)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'w') as file:
+        json.dump({"traceEvents": trace, "displayTimeUnit": "ms"}, file)
+    os.replace(tmp_path, path)
+    return len(trace)
+
+
+def start_profile():
+    # cProfile only sees the thread that enables it, here the one importing this module
+    global _profiler
+    if _profiler is None:
+        _profiler = cProfile.Profile()
+        _profiler.enable()
+
+
+def stop_profile(path):
+    global _profiler
+    if _profiler is not None:
+        _profiler.disable()
+        _profiler.dump_stats(path)
+        _profiler = None
+
+
+def _at_exit():
+    if os.environ.get(PROFILE_ENV):
+        stop_profile(os.environ[PROFILE_ENV])
+    if os.environ.get(TRACE_ENV):
+        export_chrome_trace(os.environ[TRACE_ENV])
+
+
+if os.environ.get(PROFILE_ENV):
+    start_profile()
+atexit.register(_at_exit)